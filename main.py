@@ -9,8 +9,157 @@ import os
 import re
 import json
 import math
+import gzip
+import hashlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import orjson  # 可选依赖：C实现的JSON解析，比标准库json更快
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # 可选依赖：生成.br预压缩文件
+except ImportError:
+    brotli = None
+
+
+# 模糊地区列表（应该过滤掉）
+_VAGUE_LOCATIONS = frozenset({
+    '中部', '沿海地区', '国内', '海外', '东南亚',  # 太模糊
+    '广汽', '本田', '安世'  # 公司名称，不是地理位置
+})
+
+# 缩写映射（统一使用完整名称）
+_ABBREVIATION_MAP = {
+    '印尼': '印度尼西亚',
+    '欧盟': '欧洲',  # 欧盟统一为欧洲
+}
+
+# 关系模式：匹配"子地区 关系词 父地区"的模式
+# 例如："塞梅鲁火山位于东爪哇省"、"塞梅鲁属于东爪哇"等
+_RELATIONSHIP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # 模式1: "塞梅鲁火山位于东爪哇省"
+    r'([^\s，,。；;、]+?)(?:火山|山|地区|市|省|县|区|镇|村)?(?:位于|属于|在|处于|地处|坐落于)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)',
+    # 模式2: "塞梅鲁位于东爪哇"
+    r'([^\s，,。；;、]+?)(?:位于|属于|在|处于|地处|坐落于)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)?',
+    # 模式3: "塞梅鲁的东爪哇省"
+    r'([^\s，,。；;、]+?)(?:的|地)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)',
+    # 模式4: "东爪哇省的塞梅鲁火山"（需要反转）
+    r'([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)(?:的|地)([^\s，,。；;、]+?)(?:火山|山|地区|市|省|县|区|镇|村)?',
+)]
+
+# 地名末尾的常见后缀（清理关系匹配结果时移除）
+_LOCATION_SUFFIX_RE = re.compile(r'(?:火山|山|地区|市|省|县|区|镇|村)$')
+
+# 定义地理位置层级关系（具体地点 -> 所属国家/地区）
+# 这些是基础的国家-地区关系，通常不会变化
+_LOCATION_HIERARCHY = {
+    # 印尼的具体地区
+    '东爪哇': '印度尼西亚',
+    '塞梅鲁': '印度尼西亚',  # 塞梅鲁火山在印尼
+    # 日本的具体地区
+    '鹿儿岛': '日本',
+    '福岛': '日本',
+    # 中国的具体地区
+    '东莞': '中国',
+    # 其他具体地区
+    '莱茵河': '德国',  # 莱茵河主要在德国
+}
+
+# 手动配置的地区到地区的映射（子地区 -> 父地区）
+# 这些是已知的固定关系，作为补充
+_MANUAL_REGION_TO_REGION = {
+    '塞梅鲁': '东爪哇',  # 塞梅鲁火山属于东爪哇省
+}
+
+def _build_country_to_regions() -> Dict[str, List[str]]:
+    """由地理位置层级关系构建反向映射：国家 -> 该国家的所有具体地区"""
+    country_to_regions: Dict[str, List[str]] = {}
+    for region, country in _LOCATION_HIERARCHY.items():
+        country_to_regions.setdefault(country, []).append(region)
+    return country_to_regions
+
+
+# 反向映射：国家 -> 该国家的所有具体地区
+_COUNTRY_TO_REGIONS = _build_country_to_regions()
+
+# 报告中可能出现的明确地理位置关键词（包含缩写等变体）
+_REPORT_LOCATION_KEYWORDS = (
+    '荷兰', '中国', '日本', '美国', '欧盟', '欧洲', '德国', '法国', '英国',
+    '澳大利亚', '韩国', '印度', '越南', '印尼', '印度尼西亚',
+    '福岛', '莱茵河', '鹿儿岛', '塞梅鲁', '东爪哇', '东莞',
+)
+
+# 从文本提取地理位置时使用的全部关键词（模糊地区用于匹配，但会被过滤）
+_LOCATION_KEYWORDS = _REPORT_LOCATION_KEYWORDS + (
+    '中部', '沿海地区', '国内', '海外', '东南亚',
+    '广汽', '本田', '安世',
+)
+
+# 行政级别后缀（名称带有这些后缀的地点视为更具体）
+_ADMIN_SUFFIXES = ('省', '市', '县', '区', '州')
+
+# 所有已知地理位置的坐标（用于推断地点之间的关系）
+_KNOWN_LOCATION_COORDS: Dict[str, Tuple[float, float]] = {
+    '荷兰': (52.1326, 5.2913),
+    '中国': (35.8617, 104.1954),
+    '日本': (36.2048, 138.2529),
+    '美国': (37.0902, -95.7129),
+    '欧盟': (50.1109, 8.6821),
+    '欧洲': (50.1109, 8.6821),
+    '德国': (51.1657, 10.4515),
+    '法国': (46.2276, 2.2137),
+    '英国': (55.3781, -3.4360),
+    '澳大利亚': (-25.2744, 133.7751),
+    '韩国': (35.9078, 127.7669),
+    '印度': (20.5937, 78.9629),
+    '越南': (14.0583, 108.2772),
+    '印度尼西亚': (-0.7893, 113.9213),
+    '鹿儿岛': (31.5966, 130.5571),
+    '塞梅鲁': (-8.1080, 112.9225),
+    '东爪哇': (-7.5361, 112.2384),
+    '东莞': (23.0207, 113.7518),
+    '福岛': (37.75, 140.47),
+    '莱茵河': (50.0, 7.0),
+}
+
+# 地图标记使用的地理位置坐标
+_MAP_LOCATION_COORDS = {
+    '荷兰': (52.1326, 5.2913),
+    '中国': (35.8617, 104.1954),
+    '日本': (36.2048, 138.2529),
+    '美国': (37.0902, -95.7129),
+    '欧盟': (50.1109, 8.6821),
+    '欧洲': (50.1109, 8.6821),
+    '德国': (51.1657, 10.4515),
+    '法国': (46.2276, 2.2137),
+    '英国': (55.3781, -3.4360),
+    '澳大利亚': (-25.2744, 133.7751),
+    '韩国': (35.9078, 127.7669),
+    '印度': (20.5937, 78.9629),
+    '东南亚': (1.3521, 103.8198),
+    '沿海地区': (30.0, 120.0),
+    '国内': (35.8617, 104.1954),
+    '广汽': (23.1291, 113.2644),
+    '福岛': (37.75, 140.47),
+    '越南': (14.0583, 108.2772),
+    '中部': (30.0, 108.0),
+    '印度尼西亚': (-0.7893, 113.9213),  # 统一使用完整名称，印尼会映射到这里
+    '鹿儿岛': (31.5966, 130.5571),
+    '塞梅鲁': (-8.1080, 112.9225),
+    '东爪哇': (-7.5361, 112.2384),
+    '东莞': (23.0207, 113.7518),
+    '安世': (23.0207, 113.7518),
+}
+
+# 未知地理位置的默认地图坐标
+_DEFAULT_MAP_COORDS = (30.0, 120.0)
+
 
 class RiskReportParser:
     """风险报告解析器"""
@@ -23,18 +172,43 @@ class RiskReportParser:
             file_path: 报告文件路径
         """
         self.file_path = file_path
+        self._table_text = ''
+        self._parsed: Dict = {}
         self.content = self._load_file()
     
     def _load_file(self) -> str:
-        """加载报告文件"""
+        """加载报告文件（逐行读取，同时收集以 | 开头的表格行，允许行首缩进）"""
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"未找到报告文件: {self.file_path}")
         
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        lines = []
+        table_lines = []
+        with open(self.file_path, 'r', encoding='utf-8', buffering=65536) as f:
+            for line in f:
+                lines.append(line)
+                if line.lstrip().startswith('|'):
+                    table_lines.append(line)
+        
+        self._table_text = ''.join(table_lines)
+        return ''.join(lines)
+    
+    def _memoized(self, key: str, parse):
+        """
+        返回 key 对应的解析结果，首次访问时调用 parse 计算并缓存
+        报告内容在初始化后不再变化，各部分只需解析一次；
+        各部分之间的依赖（如风险清单依赖风险详情）在首次访问时自动满足
+        """
+        parsed = self._parsed
+        if key not in parsed:
+            parsed[key] = parse()
+        return parsed[key]
     
     def extract_title(self) -> Optional[str]:
         """提取报告标题"""
+        return self._memoized('标题', self._parse_title)
+    
+    def _parse_title(self) -> Optional[str]:
+        """解析报告标题"""
         # 匹配：## 标题：xxx
         pattern = r'##\s*标题[：:]\s*(.+)'
         match = re.search(pattern, self.content)
@@ -70,24 +244,12 @@ class RiskReportParser:
         返回:
             str: 规范化后的地理位置名称，或None（如果应该过滤）
         """
-        # 模糊地区列表（应该过滤掉）
-        vague_locations = {
-            '中部', '沿海地区', '国内', '海外', '东南亚',  # 太模糊
-            '广汽', '本田', '安世'  # 公司名称，不是地理位置
-        }
-        
-        if location in vague_locations:
+        if location in _VAGUE_LOCATIONS:
             return None
         
-        # 缩写映射（统一使用完整名称）
-        abbreviation_map = {
-            '印尼': '印度尼西亚',
-            '欧盟': '欧洲',  # 欧盟统一为欧洲
-        }
-        
         # 如果找到缩写，返回完整名称
-        if location in abbreviation_map:
-            return abbreviation_map[location]
+        if location in _ABBREVIATION_MAP:
+            return _ABBREVIATION_MAP[location]
         
         return location
     
@@ -98,27 +260,18 @@ class RiskReportParser:
         返回:
             Dict[str, str]: 子地区 -> 父地区的映射字典
         """
+        return self._memoized('地理位置关系', self._parse_location_relationships)
+    
+    def _parse_location_relationships(self) -> Dict[str, str]:
+        """解析地理位置之间的关系（子地区 -> 父地区）"""
         relationships = {}
         
-        # 关系模式：匹配"子地区 关系词 父地区"的模式
-        # 例如："塞梅鲁火山位于东爪哇省"、"塞梅鲁属于东爪哇"等
-        relationship_patterns = [
-            # 模式1: "塞梅鲁火山位于东爪哇省"
-            r'([^\s，,。；;、]+?)(?:火山|山|地区|市|省|县|区|镇|村)?(?:位于|属于|在|处于|地处|坐落于)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)',
-            # 模式2: "塞梅鲁位于东爪哇"
-            r'([^\s，,。；;、]+?)(?:位于|属于|在|处于|地处|坐落于)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)?',
-            # 模式3: "塞梅鲁的东爪哇省"
-            r'([^\s，,。；;、]+?)(?:的|地)([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)',
-            # 模式4: "东爪哇省的塞梅鲁火山"（需要反转）
-            r'([^\s，,。；;、]+?)(?:省|市|县|区|地区|州)(?:的|地)([^\s，,。；;、]+?)(?:火山|山|地区|市|省|县|区|镇|村)?',
-        ]
-        
         # 从整个报告内容中提取关系
         content = self.content
         
         # 尝试匹配各种关系模式
-        for pattern_idx, pattern in enumerate(relationship_patterns):
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern_idx, pattern in enumerate(_RELATIONSHIP_PATTERNS):
+            matches = pattern.finditer(content)
             for match in matches:
                 if pattern_idx == 3:
                     # 模式4需要反转：父地区在前，子地区在后
@@ -129,8 +282,8 @@ class RiskReportParser:
                     parent = match.group(2).strip()
                 
                 # 清理提取的文本（移除常见后缀）
-                child = re.sub(r'(?:火山|山|地区|市|省|县|区|镇|村)$', '', child).strip()
-                parent = re.sub(r'(?:火山|山|地区|市|省|县|区|镇|村)$', '', parent).strip()
+                child = _LOCATION_SUFFIX_RE.sub('', child).strip()
+                parent = _LOCATION_SUFFIX_RE.sub('', parent).strip()
                 
                 # 规范化地理位置名称
                 child_normalized = self.normalize_location(child)
@@ -149,23 +302,22 @@ class RiskReportParser:
         # 只检查报告中实际出现的地理位置
         # 从报告中提取所有地理位置
         all_report_locations = set()
-        location_keywords = [
-            '荷兰', '中国', '日本', '美国', '欧盟', '欧洲', '德国', '法国', '英国',
-            '澳大利亚', '韩国', '印度', '越南', '印尼', '印度尼西亚',
-            '福岛', '莱茵河', '鹿儿岛', '塞梅鲁', '东爪哇', '东莞',
-        ]
-        
-        for keyword in location_keywords:
+        for keyword in _REPORT_LOCATION_KEYWORDS:
             if keyword in content:
                 normalized = self.normalize_location(keyword)
                 if normalized and normalized not in ['未明确']:
                     all_report_locations.add(normalized)
         
         # 获取所有已知的地理位置坐标
-        location_coords = self._get_all_location_coords()
+        location_coords = _KNOWN_LOCATION_COORDS
         
         # 只计算报告中出现的地理位置之间的距离
         report_locations_list = list(all_report_locations)
+        # 每个地点的弧度坐标只换算一次，两两比较时直接复用
+        radian_coords = {
+            loc: self._to_radians(location_coords[loc])
+            for loc in report_locations_list if loc in location_coords
+        }
         for i, loc1 in enumerate(report_locations_list):
             for loc2 in report_locations_list[i+1:]:
                 if loc1 == loc2:
@@ -176,14 +328,14 @@ class RiskReportParser:
                     continue
                 
                 # 获取坐标
-                coord1 = location_coords.get(loc1)
-                coord2 = location_coords.get(loc2)
+                rad1 = radian_coords.get(loc1)
+                rad2 = radian_coords.get(loc2)
                 
-                if not coord1 or not coord2:
+                if not rad1 or not rad2:
                     continue
                 
                 # 计算两个地点之间的距离（使用Haversine公式）
-                distance = self._calculate_distance(coord1, coord2)
+                distance = self._haversine_distance(rad1, rad2)
                 
                 # 如果距离小于100公里，可能是同一地区
                 # 选择名称更具体的作为父地区（通常名称更长的更具体，或者包含"省"、"市"等后缀的）
@@ -191,11 +343,11 @@ class RiskReportParser:
                     # 判断哪个更具体（名称更长，或包含行政级别后缀）
                     loc1_is_more_specific = (
                         len(loc1) > len(loc2) or 
-                        any(suffix in loc1 for suffix in ['省', '市', '县', '区', '州'])
+                        any(suffix in loc1 for suffix in _ADMIN_SUFFIXES)
                     )
                     loc2_is_more_specific = (
                         len(loc2) > len(loc1) or 
-                        any(suffix in loc2 for suffix in ['省', '市', '县', '区', '州'])
+                        any(suffix in loc2 for suffix in _ADMIN_SUFFIXES)
                     )
                     
                     if loc2_is_more_specific and not loc1_is_more_specific:
@@ -205,50 +357,21 @@ class RiskReportParser:
         
         return relationships
     
-    def _get_all_location_coords(self) -> Dict[str, Tuple[float, float]]:
-        """获取所有已知地理位置的坐标"""
-        return {
-            '荷兰': (52.1326, 5.2913),
-            '中国': (35.8617, 104.1954),
-            '日本': (36.2048, 138.2529),
-            '美国': (37.0902, -95.7129),
-            '欧盟': (50.1109, 8.6821),
-            '欧洲': (50.1109, 8.6821),
-            '德国': (51.1657, 10.4515),
-            '法国': (46.2276, 2.2137),
-            '英国': (55.3781, -3.4360),
-            '澳大利亚': (-25.2744, 133.7751),
-            '韩国': (35.9078, 127.7669),
-            '印度': (20.5937, 78.9629),
-            '越南': (14.0583, 108.2772),
-            '印度尼西亚': (-0.7893, 113.9213),
-            '鹿儿岛': (31.5966, 130.5571),
-            '塞梅鲁': (-8.1080, 112.9225),
-            '东爪哇': (-7.5361, 112.2384),
-            '东莞': (23.0207, 113.7518),
-            '福岛': (37.75, 140.47),
-            '莱茵河': (50.0, 7.0),
-        }
+    def _to_radians(self, coord: Tuple[float, float]) -> Tuple[float, float, float]:
+        """将(纬度, 经度)转换为(纬度弧度, 经度弧度, 纬度余弦)"""
+        lat_rad = math.radians(coord[0])
+        return lat_rad, math.radians(coord[1]), math.cos(lat_rad)
     
-    def _calculate_distance(self, coord1: Tuple[float, float], coord2: Tuple[float, float]) -> float:
-        """
-        计算两个地理坐标之间的距离（公里）
-        使用Haversine公式
-        """
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
-        
-        # 转换为弧度
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+    def _haversine_distance(self, rad1: Tuple[float, float, float], rad2: Tuple[float, float, float]) -> float:
+        """基于预先换算好的弧度坐标计算距离（公里）"""
+        lat1_rad, lon1_rad, cos_lat1 = rad1
+        lat2_rad, lon2_rad, cos_lat2 = rad2
         
         # Haversine公式
         dlat = lat2_rad - lat1_rad
         dlon = lon2_rad - lon1_rad
         
-        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+        a = math.sin(dlat/2)**2 + cos_lat1 * cos_lat2 * math.sin(dlon/2)**2
         c = 2 * math.asin(math.sqrt(a))
         
         # 地球半径（公里）
@@ -271,40 +394,14 @@ class RiskReportParser:
         if not locations:
             return locations
         
-        # 定义地理位置层级关系（具体地点 -> 所属国家/地区）
-        # 这些是基础的国家-地区关系，通常不会变化
-        location_hierarchy = {
-            # 印尼的具体地区
-            '东爪哇': '印度尼西亚',
-            '塞梅鲁': '印度尼西亚',  # 塞梅鲁火山在印尼
-            # 日本的具体地区
-            '鹿儿岛': '日本',
-            '福岛': '日本',
-            # 中国的具体地区
-            '东莞': '中国',
-            # 其他具体地区
-            '莱茵河': '德国',  # 莱茵河主要在德国
-        }
-        
-        # 手动配置的地区到地区的映射（子地区 -> 父地区）
-        # 这些是已知的固定关系，作为补充
-        manual_region_to_region = {
-            '塞梅鲁': '东爪哇',  # 塞梅鲁火山属于东爪哇省
-        }
-        
         # 动态提取地区到地区的映射（从报告文本中提取）
         # 优先使用动态提取的关系，因为它更符合当前报告的内容
         dynamic_region_to_region = self.extract_location_relationships()
         
         # 合并关系映射：动态提取的关系优先，手动配置作为补充
-        region_to_region = {**manual_region_to_region, **dynamic_region_to_region}
-        
-        # 创建反向映射：国家 -> 该国家的所有具体地区
-        country_to_regions = {}
-        for region, country in location_hierarchy.items():
-            if country not in country_to_regions:
-                country_to_regions[country] = []
-            country_to_regions[country].append(region)
+        region_to_region = {**_MANUAL_REGION_TO_REGION, **dynamic_region_to_region}
+        location_hierarchy = _LOCATION_HIERARCHY
+        country_to_regions = _COUNTRY_TO_REGIONS
         
         filtered = []
         for loc in locations:
@@ -358,15 +455,7 @@ class RiskReportParser:
         """
         locations = []
         
-        # 常见地理位置关键词（包含所有可能的变体）
-        location_keywords = [
-            '荷兰', '中国', '日本', '美国', '欧盟', '欧洲', '德国', '法国', '英国',
-            '澳大利亚', '韩国', '印度', '越南', '印尼', '印度尼西亚',
-            '福岛', '莱茵河', '鹿儿岛', '塞梅鲁', '东爪哇', '东莞',
-            # 模糊地区（用于匹配，但会被过滤）
-            '中部', '沿海地区', '国内', '海外', '东南亚',
-            '广汽', '本田', '安世'
-        ]
+        location_keywords = _LOCATION_KEYWORDS
         
         # 从文本中查找地理位置
         for keyword in location_keywords:
@@ -398,15 +487,19 @@ class RiskReportParser:
         返回:
             List[Dict]: 风险列表，每个风险包含序号、名称、类别、等级、描述、地理位置
         """
+        return self._memoized('风险清单', self._parse_risk_list)
+    
+    def _parse_risk_list(self) -> List[Dict]:
+        """解析风险清单表格（只扫描读取文件时收集的表格行）"""
         risks = []
+        _append = risks.append
         
         # 匹配表格行：| 序号 | 风险名称 | 风险类别 | 风险等级 | 风险描述 |
         # 跳过表头行
         pattern = r'\|\s*(\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        matches = re.findall(pattern, self.content)
         
-        for match in matches:
-            seq, name, category, level, description = match
+        for match in re.finditer(pattern, self._table_text):
+            seq, name, category, level, description = match.groups()
             # 提取地理位置（extract_location_from_text已经应用了规范化和去重）
             locations = self.extract_location_from_text(description)
             # 也从风险详情中提取
@@ -424,7 +517,7 @@ class RiskReportParser:
             # 再次过滤冗余（因为可能从多个来源提取，需要统一去重）
             locations = self.filter_redundant_locations(locations)
             
-            risks.append({
+            _append({
                 '序号': int(seq.strip()),
                 '风险名称': name.strip(),
                 '风险类别': category.strip(),
@@ -442,14 +535,19 @@ class RiskReportParser:
         返回:
             List[Dict]: 风险详情列表，每个风险包含触发条件、风险表现、风险等级、判断依据、风险应对
         """
+        return self._memoized('风险详情', self._parse_risk_details)
+    
+    def _parse_risk_details(self) -> List[Dict]:
+        """解析风险详情块"""
         details = []
+        _append = details.append
         
         # 匹配风险详情块：##### （序号）风险名称
         # 然后提取后续内容直到下一个风险或章节结束
         pattern = r'#####\s*（(\d+)）\s*([^\n]+)\n(.*?)(?=#####|####|###|$)'
-        matches = re.findall(pattern, self.content, re.DOTALL)
         
-        for seq, name, content in matches:
+        for match in re.finditer(pattern, self.content, re.DOTALL):
+            seq, name, content = match.groups()
             detail = {
                 '序号': int(seq),
                 '风险名称': name.strip(),
@@ -459,7 +557,7 @@ class RiskReportParser:
                 '判断依据': self._extract_judgment_basis(content),
                 '风险应对': self._extract_countermeasures(content)
             }
-            details.append(detail)
+            _append(detail)
         
         return details
     
@@ -498,6 +596,10 @@ class RiskReportParser:
     
     def extract_risk_summary(self) -> Optional[str]:
         """提取风险速览"""
+        return self._memoized('风险速览', self._parse_risk_summary)
+    
+    def _parse_risk_summary(self) -> Optional[str]:
+        """解析风险速览"""
         # 匹配：#### 数字. 风险速览 后面的内容（支持不同的编号）
         pattern = r'####\s*\d+\.\s*风险速览\s*\n(.+?)(?=\n---|\n####|$)'
         match = re.search(pattern, self.content, re.DOTALL)
@@ -512,6 +614,10 @@ class RiskReportParser:
     
     def extract_author(self) -> Optional[str]:
         """提取作者署名"""
+        return self._memoized('作者', self._parse_author)
+    
+    def _parse_author(self) -> Optional[str]:
+        """解析作者署名"""
         # 匹配：作者署名[：:]\s*(.+)（旧格式）
         pattern = r'作者署名[：:]\s*(.+)'
         match = re.search(pattern, self.content)
@@ -531,6 +637,10 @@ class RiskReportParser:
     
     def extract_date(self) -> Optional[str]:
         """提取日期"""
+        return self._memoized('日期', self._parse_date)
+    
+    def _parse_date(self) -> Optional[str]:
+        """解析日期"""
         # 匹配：日期[：:]\s*(\d{4}-\d{2}-\d{2})（旧格式）
         pattern = r'日期[：:]\s*(\d{4}-\d{2}-\d{2})'
         match = re.search(pattern, self.content)
@@ -629,639 +739,585 @@ def print_report_summary(parsed_data: Dict):
 def load_coordinate_cache() -> Dict:
     """加载坐标缓存文件"""
     cache_file = "coordinate_cache.json"
-    if os.path.exists(cache_file):
-        try:
+    try:
+        if orjson is not None:
+            with open(cache_file, 'rb') as f:
+                cache = orjson.loads(f.read())
+        else:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 cache = json.load(f)
-                # 转换格式：确保所有坐标都是数组格式 [lat, lon]
-                normalized_cache = {}
-                for key, value in cache.items():
-                    if isinstance(value, list) and len(value) >= 2:
-                        normalized_cache[key] = [float(value[0]), float(value[1])]
-                return normalized_cache
-        except Exception as e:
-            print(f"警告: 读取坐标缓存失败: {e}")
-            return {}
-    return {}
+        # 转换格式：确保所有坐标都是数组格式 [lat, lon]
+        # 保留5位小数（约1米精度），足够地图展示，同时减小嵌入HTML的数据量
+        normalized_cache = {}
+        for key, value in cache.items():
+            if isinstance(value, list) and len(value) >= 2:
+                normalized_cache[key] = [round(float(value[0]), 5), round(float(value[1]), 5)]
+        return normalized_cache
+    except FileNotFoundError:
+        # 缓存文件不存在属于正常情况（首次运行）
+        return {}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        # ValueError 覆盖 json/orjson 的 JSONDecodeError；其余为读取失败或缓存结构异常
+        print(f"警告: 读取坐标缓存失败: {e}")
+        return {}
 
 def get_location_coords(location: str) -> tuple:
     """获取地理位置的坐标（用于地图标记）"""
-    location_coords = {
-        '荷兰': (52.1326, 5.2913),
-        '中国': (35.8617, 104.1954),
-        '日本': (36.2048, 138.2529),
-        '美国': (37.0902, -95.7129),
-        '欧盟': (50.1109, 8.6821),
-        '欧洲': (50.1109, 8.6821),
-        '德国': (51.1657, 10.4515),
-        '法国': (46.2276, 2.2137),
-        '英国': (55.3781, -3.4360),
-        '澳大利亚': (-25.2744, 133.7751),
-        '韩国': (35.9078, 127.7669),
-        '印度': (20.5937, 78.9629),
-        '东南亚': (1.3521, 103.8198),
-        '沿海地区': (30.0, 120.0),
-        '国内': (35.8617, 104.1954),
-        '广汽': (23.1291, 113.2644),
-        '福岛': (37.75, 140.47),
-        '越南': (14.0583, 108.2772),
-        '中部': (30.0, 108.0),
-        '印度尼西亚': (-0.7893, 113.9213),  # 统一使用完整名称，印尼会映射到这里
-        '鹿儿岛': (31.5966, 130.5571),
-        '塞梅鲁': (-8.1080, 112.9225),
-        '东爪哇': (-7.5361, 112.2384),
-        '东莞': (23.0207, 113.7518),
-        '安世': (23.0207, 113.7518),
+    return _MAP_LOCATION_COORDS.get(location, _DEFAULT_MAP_COORDS)
+
+def _dumps_json(obj, indent: bool = False) -> str:
+    """
+    将数据序列化为嵌入HTML的JSON字符串（保留中文字符）
+    
+    安装了orjson时使用orjson（C实现，输出紧凑），否则回退到标准库json
+    
+    参数:
+        obj: 要序列化的数据
+        indent: 是否以2个空格缩进输出（便于阅读生成的页面源码）
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+def _compact_html(fragment: str) -> str:
+    """压缩HTML片段：去掉每行首尾的缩进空白和空行（页面中没有<pre>/<textarea>等对空白敏感的内容）"""
+    return ''.join(line.strip() + '\n' for line in fragment.splitlines() if line.strip())
+
+def _minify_css(css: str) -> str:
+    """压缩CSS：去掉注释，合并空白"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};])\s*', r'\1', css)
+    return css.strip()
+
+
+# 国家边界的简化程度（Leaflet smoothFactor，单位为屏幕像素）
+# 值越大绘制的顶点越少、渲染越快，世界视图下1.5基本看不出差别
+MAP_SIMPLIFY_TOLERANCE = 1.5
+
+
+# 报告页面样式（内容固定，导入时压缩一次，生成报告时直接复用）
+_REPORT_CSS = """
+    * {
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }
+    
+    body {
+        font-family: 'Microsoft YaHei', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        line-height: 1.6;
+        color: #333;
+        background: #f5f5f5;
+        padding: 20px;
+    }
+    
+    .container {
+        max-width: 1200px;
+        margin: 0 auto;
+        background: white;
+        padding: 40px;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+    
+    h1 {
+        color: #2c3e50;
+        border-bottom: 3px solid #3498db;
+        padding-bottom: 10px;
+        margin-bottom: 30px;
+    }
+    
+    .meta {
+        color: #7f8c8d;
+        margin-bottom: 30px;
+        font-size: 14px;
+    }
+    
+    .meta span {
+        margin-right: 20px;
+    }
+    
+    h2 {
+        color: #34495e;
+        margin-top: 40px;
+        margin-bottom: 20px;
+        padding-left: 10px;
+        border-left: 4px solid #3498db;
+    }
+    
+    h3 {
+        color: #555;
+        margin-top: 30px;
+        margin-bottom: 15px;
+    }
+    
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 20px 0;
+        font-size: 14px;
+    }
+    
+    th, td {
+        padding: 12px;
+        text-align: left;
+        border-bottom: 1px solid #ddd;
+    }
+    
+    th {
+        background: #3498db;
+        color: white;
+        font-weight: 600;
+    }
+    
+    tr:hover {
+        background: #f8f9fa;
+    }
+    
+    .risk-level-high {
+        color: #e74c3c;
+        font-weight: bold;
+    }
+    
+    .risk-level-medium {
+        color: #f39c12;
+        font-weight: bold;
+    }
+    
+    .risk-level-low {
+        color: #27ae60;
+        font-weight: bold;
+    }
+    
+    .risk-detail {
+        margin: 30px 0;
+        padding: 20px;
+        background: #f8f9fa;
+        border-radius: 6px;
+        border-left: 4px solid #3498db;
+    }
+    
+    .risk-detail h4 {
+        color: #2c3e50;
+        margin-bottom: 15px;
+    }
+    
+    .risk-detail p {
+        margin: 10px 0;
+    }
+    
+    .risk-detail strong {
+        color: #34495e;
+    }
+    
+    .countermeasures {
+        margin-top: 15px;
+    }
+    
+    .countermeasures ol {
+        margin-left: 20px;
+    }
+    
+    .countermeasures li {
+        margin: 8px 0;
+    }
+    
+    .summary {
+        background: #fff3cd;
+        padding: 20px;
+        border-radius: 6px;
+        border-left: 4px solid #ffc107;
+        margin: 30px 0;
+    }
+    
+    .summary .markdown-content {
+        line-height: 1.8;
+    }
+    
+    .summary .markdown-content ul {
+        margin: 10px 0;
+        padding-left: 25px;
+    }
+    
+    .summary .markdown-content li {
+        margin: 8px 0;
+    }
+    
+    .summary .markdown-content strong {
+        color: #856404;
+        font-weight: 600;
+    }
+    
+    .summary .markdown-content p {
+        margin: 10px 0;
+    }
+    
+    .stats {
+        display: flex;
+        gap: 30px;
+        margin: 30px 0;
+    }
+    
+    .stat-box {
+        flex: 1;
+        padding: 20px;
+        background: #ecf0f1;
+        border-radius: 6px;
+        text-align: center;
+    }
+    
+    .stat-box h4 {
+        color: #7f8c8d;
+        margin-bottom: 10px;
+    }
+    
+    .stat-box .number {
+        font-size: 32px;
+        font-weight: bold;
+        color: #3498db;
+    }
+    
+    .location-tag {
+        display: inline-block;
+        padding: 4px 8px;
+        margin: 2px;
+        background: #e3f2fd;
+        color: #1976d2;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    
+    .map-container {
+        width: 100%;
+        height: 500px;
+        margin: 20px 0;
+        border-radius: 8px;
+        overflow: hidden;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
     }
-    return location_coords.get(location, (30.0, 120.0))  # 默认坐标
+    /* 地图图例（样式放在样式表中，脚本只负责创建元素） */
+    .map-legend {
+        background-color: white;
+        padding: 10px;
+        border-radius: 5px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+        font-family: 'Microsoft YaHei', sans-serif;
+        font-size: 12px;
+    }
+    
+    .map-legend-title {
+        font-weight: bold;
+        margin-bottom: 8px;
+        color: #2c3e50;
+    }
+    
+    .map-legend-item {
+        display: flex;
+        align-items: center;
+        margin: 5px 0;
+    }
+    
+    .map-legend-dot {
+        width: 12px;
+        height: 12px;
+        border-radius: 50%;
+        border: 2px solid #fff;
+        margin-right: 8px;
+        flex-shrink: 0;
+    }
+    
+    .map-legend-dot.high { background: #e74c3c; }
+    .map-legend-dot.medium { background: #f39c12; width: 10px; height: 10px; }
+    .map-legend-dot.low { background: #27ae60; width: 8px; height: 8px; }
+    
+    /* 点击国家边界/标记时不显示浏览器默认的焦点框（纯CSS实现，无需脚本逐个处理路径） */
+    .map-container path.leaflet-interactive:focus,
+    .map-container path.leaflet-interactive:focus-visible {
+        outline: none;
+    }
+    
+    .arrow-marker {
+        background: transparent !important;
+        border: none !important;
+    }
+    
+    .arrowhead {
+        background: transparent !important;
+        border: none !important;
+    }
+    
+    .risk-cards {
+        display: grid;
+        grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+        gap: 20px;
+        margin: 30px 0;
+    }
+    
+    .risk-card {
+        background: white;
+        border: 2px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 20px;
+        transition: all 0.3s ease;
+        cursor: pointer;
+    }
+    
+    .risk-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        border-color: #3498db;
+    }
+    
+    .risk-card.high {
+        border-left: 4px solid #e74c3c;
+    }
+    
+    .risk-card.medium {
+        border-left: 4px solid #f39c12;
+    }
+    
+    .risk-card.low {
+        border-left: 4px solid #27ae60;
+    }
+    
+    .risk-card h4 {
+        margin: 0 0 10px 0;
+        color: #2c3e50;
+    }
+    
+    .risk-card .level {
+        display: inline-block;
+        padding: 4px 12px;
+        border-radius: 12px;
+        font-size: 12px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    
+    .risk-card .level.high {
+        background: #e74c3c;
+        color: white;
+    }
+    
+    .risk-card .level.medium {
+        background: #f39c12;
+        color: white;
+    }
+    
+    .risk-card .level.low {
+        background: #27ae60;
+        color: white;
+    }
+    
+    .view-toggle {
+        display: flex;
+        gap: 10px;
+        margin: 0;
+        margin-left: auto;
+    }
+    
+    .section-header {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        margin-top: 40px;
+        margin-bottom: 20px;
+    }
+    
+    .section-header h2 {
+        margin: 0 !important;
+        padding-left: 10px;
+        border-left: 4px solid #3498db;
+        color: #34495e;
+    }
+    
+    .view-toggle button {
+        padding: 10px 20px;
+        border: 2px solid #3498db;
+        background: white;
+        color: #3498db;
+        border-radius: 6px;
+        cursor: pointer;
+        font-size: 14px;
+        transition: all 0.3s ease;
+    }
+    
+    .view-toggle button.active {
+        background: #3498db;
+        color: white;
+    }
+    
+    .view-toggle button:hover {
+        background: #2980b9;
+        color: white;
+        border-color: #2980b9;
+    }
+    
+    .view-section {
+        display: none;
+    }
+    
+    .view-section.active {
+        display: block;
+    }
+"""
+_REPORT_CSS_HTML = f'<style>{_minify_css(_REPORT_CSS)}</style>'
 
-def generate_html_report(parsed_data: Dict, output_file: str):
-    """生成HTML格式的报告"""
-    html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{parsed_data['标题'] or '风险报告'}</title>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
+# 风险等级 -> 表格单元格/风险卡片使用的CSS类名
+_TABLE_LEVEL_CLASSES = {'高': 'risk-level-高', '中': 'risk-level-中', '低': 'risk-level-低'}
+_CARD_LEVEL_CLASSES = {'高': '高', '中': '中', '低': '低'}
+
+
+# 可能生成的全部预压缩副本后缀
+_PRECOMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def _precompressed_suffixes() -> Tuple[str, ...]:
+    """返回 write_precompressed 在当前环境下会生成的预压缩副本后缀（未安装brotli时不生成.br）"""
+    return _PRECOMPRESSED_SUFFIXES if brotli is not None else ('.gz',)
+
+
+def _remove_precompressed(output_file: str, suffixes: Tuple[str, ...] = _PRECOMPRESSED_SUFFIXES):
+    """
+    删除输出文件旁的预压缩副本，避免静态服务器继续返回旧内容
+    
+    参数:
+        output_file: 原始文件路径
+        suffixes: 要删除的副本后缀
+    """
+    for suffix in suffixes:
+        try:
+            os.remove(output_file + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def _write_sidecar(path: str, write) -> int:
+    """
+    通过临时文件写入预压缩副本，写完后原子替换，中途失败不会留下不完整的副本
+    
+    参数:
+        path: 副本文件路径
+        write: 接收已打开的二进制文件对象并写入内容的函数
+    
+    返回:
+        int: 写入的字节数
+    """
+    tmp_file = path + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as f:
+            write(f)
+            size = f.tell()
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    return size
+
+
+def write_precompressed(output_file: str, chunks: List[bytes]):
+    """
+    在输出文件旁生成预压缩副本（.gz，安装brotli时另生成.br），
+    静态服务器可直接以Content-Encoding返回，减少传输体积
+    各片段逐个送入压缩器，不拼接整页内容
+    
+    参数:
+        output_file: 原始文件路径
+        chunks: 原始文件内容（按顺序排列的UTF-8字节片段）
+    """
+    sizes = [f"原始 {sum(map(len, chunks)) / 1024:.1f}KB"]
+    
+    def write_gzip(f):
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=6, fileobj=f) as gz_file:
+            gz_file.writelines(chunks)
+    
+    size = _write_sidecar(output_file + '.gz', write_gzip)
+    sizes.append(f"gzip {size / 1024:.1f}KB")
+    
+    if brotli is not None:
+        def write_brotli(f):
+            compressor = brotli.Compressor(quality=5)
+            for chunk in chunks:
+                f.write(compressor.process(chunk))
+            f.write(compressor.finish())
+        
+        size = _write_sidecar(output_file + '.br', write_brotli)
+        sizes.append(f"brotli {size / 1024:.1f}KB")
+    else:
+        # 未安装brotli时删除之前生成的.br，避免与新的.gz内容不一致
+        _remove_precompressed(output_file, ('.br',))
+    
+    print(f"  预压缩文件: {', '.join(sizes)}")
+
+
+# 报告页面的交互脚本（视图切换、地图绘制等，与报告数据无关）
+# 导入时生成并压缩一次，所有报告直接复用；报告数据由generate_html_report单独写入前一个<script>
+_REPORT_SCRIPT_HTML = _compact_html(f'''
+    <script>
+        // 规范化地理位置名称（与后端保持一致）
+        function normalizeLocation(location) {{
+            // 模糊地区（应该过滤）
+            const vagueLocations = ['中部', '沿海地区', '国内', '海外', '东南亚', '广汽', '本田', '安世'];
+            if (vagueLocations.includes(location)) {{
+                return null;
+            }}
+            
+            // 缩写映射
+            const abbreviationMap = {{
+                '印尼': '印度尼西亚',
+                '欧盟': '欧洲'
+            }};
+            
+            return abbreviationMap[location] || location;
         }}
         
-        body {{
-            font-family: 'Microsoft YaHei', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
+        // 预设坐标（只保留规范化后的名称）
+        const presetCoords = {{
+            '荷兰': [52.1326, 5.2913],
+            '中国': [35.8617, 104.1954],
+            '日本': [36.2048, 138.2529],
+            '美国': [37.0902, -95.7129],
+            '欧洲': [50.1109, 8.6821],
+            '德国': [51.1657, 10.4515],
+            '法国': [46.2276, 2.2137],
+            '英国': [55.3781, -3.4360],
+            '澳大利亚': [-25.2744, 133.7751],
+            '韩国': [35.9078, 127.7669],
+            '印度': [20.5937, 78.9629],
+            '越南': [14.0583, 108.2772],
+            '印度尼西亚': [-0.7893, 113.9213],
+            '福岛': [37.75, 140.47],
+            '鹿儿岛': [31.5966, 130.5571],
+            '塞梅鲁': [-8.1080, 112.9225],
+            '东爪哇': [-7.5361, 112.2384],
+            '东莞': [23.0207, 113.7518],
+        }};
+        
+        // 地理编码结果的本地持久化缓存（localStorage），以及正在进行中的请求（地点 -> Promise）
+        const GEOCODE_CACHE_PREFIX = 'scrv_geocode_';
+        const pendingGeocodes = new Map();
+        
+        function readGeocodeCache(location) {{
+            try {{
+                const raw = localStorage.getItem(GEOCODE_CACHE_PREFIX + location);
+                return raw ? JSON.parse(raw) : null;
+            }} catch (error) {{
+                return null; // localStorage不可用或数据损坏
+            }}
         }}
         
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-            margin-bottom: 30px;
-        }}
-        
-        .meta {{
-            color: #7f8c8d;
-            margin-bottom: 30px;
-            font-size: 14px;
-        }}
-        
-        .meta span {{
-            margin-right: 20px;
-        }}
-        
-        h2 {{
-            color: #34495e;
-            margin-top: 40px;
-            margin-bottom: 20px;
-            padding-left: 10px;
-            border-left: 4px solid #3498db;
-        }}
-        
-        h3 {{
-            color: #555;
-            margin-top: 30px;
-            margin-bottom: 15px;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            font-size: 14px;
-        }}
-        
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        
-        th {{
-            background: #3498db;
-            color: white;
-            font-weight: 600;
-        }}
-        
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        
-        .risk-level-high {{
-            color: #e74c3c;
-            font-weight: bold;
-        }}
-        
-        .risk-level-medium {{
-            color: #f39c12;
-            font-weight: bold;
-        }}
-        
-        .risk-level-low {{
-            color: #27ae60;
-            font-weight: bold;
-        }}
-        
-        .risk-detail {{
-            margin: 30px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 6px;
-            border-left: 4px solid #3498db;
-        }}
-        
-        .risk-detail h4 {{
-            color: #2c3e50;
-            margin-bottom: 15px;
-        }}
-        
-        .risk-detail p {{
-            margin: 10px 0;
-        }}
-        
-        .risk-detail strong {{
-            color: #34495e;
-        }}
-        
-        .countermeasures {{
-            margin-top: 15px;
-        }}
-        
-        .countermeasures ol {{
-            margin-left: 20px;
-        }}
-        
-        .countermeasures li {{
-            margin: 8px 0;
-        }}
-        
-        .summary {{
-            background: #fff3cd;
-            padding: 20px;
-            border-radius: 6px;
-            border-left: 4px solid #ffc107;
-            margin: 30px 0;
-        }}
-        
-        .summary .markdown-content {{
-            line-height: 1.8;
-        }}
-        
-        .summary .markdown-content ul {{
-            margin: 10px 0;
-            padding-left: 25px;
-        }}
-        
-        .summary .markdown-content li {{
-            margin: 8px 0;
-        }}
-        
-        .summary .markdown-content strong {{
-            color: #856404;
-            font-weight: 600;
-        }}
-        
-        .summary .markdown-content p {{
-            margin: 10px 0;
-        }}
-        
-        .stats {{
-            display: flex;
-            gap: 30px;
-            margin: 30px 0;
-        }}
-        
-        .stat-box {{
-            flex: 1;
-            padding: 20px;
-            background: #ecf0f1;
-            border-radius: 6px;
-            text-align: center;
-        }}
-        
-        .stat-box h4 {{
-            color: #7f8c8d;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-box .number {{
-            font-size: 32px;
-            font-weight: bold;
-            color: #3498db;
-        }}
-        
-        .location-tag {{
-            display: inline-block;
-            padding: 4px 8px;
-            margin: 2px;
-            background: #e3f2fd;
-            color: #1976d2;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: 500;
-        }}
-        
-        .map-container {{
-            width: 100%;
-            height: 500px;
-            margin: 20px 0;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .arrow-marker {{
-            background: transparent !important;
-            border: none !important;
-        }}
-        
-        .arrowhead {{
-            background: transparent !important;
-            border: none !important;
-        }}
-        
-        .risk-cards {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        
-        .risk-card {{
-            background: white;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-        
-        .risk-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            border-color: #3498db;
-        }}
-        
-        .risk-card.high {{
-            border-left: 4px solid #e74c3c;
-        }}
-        
-        .risk-card.medium {{
-            border-left: 4px solid #f39c12;
-        }}
-        
-        .risk-card.low {{
-            border-left: 4px solid #27ae60;
-        }}
-        
-        .risk-card h4 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-        }}
-        
-        .risk-card .level {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        
-        .risk-card .level.high {{
-            background: #e74c3c;
-            color: white;
-        }}
-        
-        .risk-card .level.medium {{
-            background: #f39c12;
-            color: white;
-        }}
-        
-        .risk-card .level.low {{
-            background: #27ae60;
-            color: white;
-        }}
-        
-        .view-toggle {{
-            display: flex;
-            gap: 10px;
-            margin: 0;
-            margin-left: auto;
-        }}
-        
-        .section-header {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            margin-top: 40px;
-            margin-bottom: 20px;
-        }}
-        
-        .section-header h2 {{
-            margin: 0 !important;
-            padding-left: 10px;
-            border-left: 4px solid #3498db;
-            color: #34495e;
-        }}
-        
-        .view-toggle button {{
-            padding: 10px 20px;
-            border: 2px solid #3498db;
-            background: white;
-            color: #3498db;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 14px;
-            transition: all 0.3s ease;
-        }}
-        
-        .view-toggle button.active {{
-            background: #3498db;
-            color: white;
-        }}
-        
-        .view-toggle button:hover {{
-            background: #2980b9;
-            color: white;
-            border-color: #2980b9;
-        }}
-        
-        .view-section {{
-            display: none;
-        }}
-        
-        .view-section.active {{
-            display: block;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{parsed_data['标题'] or '风险报告'}</h1>
-        
-        <div class="meta">
-            <span>作者: {parsed_data['作者'] or '未知'}</span>
-            <span>日期: {parsed_data['日期'] or '未知'}</span>
-        </div>
-        
-        <h2>1. 风险速览</h2>
-'''
-    
-    # 添加风险速览（使用markdown渲染）
-    if parsed_data['风险速览']:
-        # 将markdown内容转换为JSON字符串以便安全嵌入HTML
-        summary_markdown = json.dumps(parsed_data['风险速览'], ensure_ascii=False)
-        html += f'''
-        <div class="summary">
-            <div class="markdown-content" id="risk-summary-content"></div>
-            <script>
-                (function() {{
-                    const summaryMarkdown = {summary_markdown};
-                    const summaryContent = document.getElementById('risk-summary-content');
-                    if (summaryContent && typeof marked !== 'undefined') {{
-                        summaryContent.innerHTML = marked.parse(summaryMarkdown);
-                    }} else if (summaryContent) {{
-                        // 如果marked库未加载，显示原始文本
-                        summaryContent.textContent = summaryMarkdown;
-                    }}
-                }})();
-            </script>
-        </div>
-'''
-    
-    html += '''
-        <div class="section-header">
-            <h2>2. 风险清单</h2>
-            <div class="view-toggle">
-                <button data-view="table" class="view-toggle-btn">表格视图</button>
-                <button data-view="cards" class="view-toggle-btn">卡片视图</button>
-                <button data-view="map" class="view-toggle-btn active">地图视图</button>
-            </div>
-        </div>
-        
-        <div id="table-view" class="view-section">
-            <table>
-                <thead>
-                    <tr>
-                        <th>序号</th>
-                        <th>风险名称</th>
-                        <th>风险类别</th>
-                        <th>风险等级</th>
-                        <th>地理位置</th>
-                        <th>风险描述</th>
-                    </tr>
-                </thead>
-                <tbody>
-'''
-    
-    # 添加风险清单表格行
-    for risk in parsed_data['风险清单']:
-        level_class = f"risk-level-{risk['风险等级'].lower()}" if risk['风险等级'] in ['高', '中', '低'] else ""
-        locations = risk.get('地理位置', ['未明确'])
-        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
-        html += f'''
-                <tr>
-                    <td>{risk['序号']}</td>
-                    <td>{risk['风险名称']}</td>
-                    <td>{risk['风险类别']}</td>
-                    <td class="{level_class}">{risk['风险等级']}</td>
-                    <td>{location_html}</td>
-                    <td>{risk['风险描述']}</td>
-                </tr>
-'''
-    
-    html += '''
-            </tbody>
-        </table>
-        </div>
-        
-        <div id="cards-view" class="view-section">
-            <div class="risk-cards">
-'''
-    
-    # 添加风险卡片
-    for risk in parsed_data['风险清单']:
-        level = risk['风险等级'].lower()
-        level_class = level if level in ['高', '中', '低'] else 'medium'
-        locations = risk.get('地理位置', ['未明确'])
-        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
-        html += f'''
-                <div class="risk-card {level_class}" onclick="scrollToDetail({risk['序号']})">
-                    <h4>{risk['风险名称']}</h4>
-                    <div>
-                        <span class="level {level_class}">{risk['风险等级']}风险</span>
-                    </div>
-                    <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
-                        <strong>类别：</strong>{risk['风险类别']}
-                    </p>
-                    <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
-                        <strong>地理位置：</strong>{location_html}
-                    </p>
-                    <p style="color: #555; font-size: 14px; margin-top: 10px;">
-                        {risk['风险描述'][:80]}{'...' if len(risk['风险描述']) > 80 else ''}
-                    </p>
-                </div>
-'''
-    
-    html += '''
-            </div>
-        </div>
-        
-        <div id="map-view" class="view-section active">
-            <div style="margin-bottom: 10px; display: flex; align-items: center; gap: 10px;">
-                <label for="map-style-selector" style="font-size: 14px; color: #555; font-weight: 500;">地图样式：</label>
-                <select id="map-style-selector" style="padding: 6px 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; background: white; cursor: pointer; min-width: 200px;">
-                    <optgroup label="⭐ 准确地图（推荐）">
-                        <option value="osm-china">OpenStreetMap中国</option>
-                        <option value="amap-normal">高德地图</option>
-                        <option value="tencent-normal">腾讯地图</option>
-                    </optgroup>
-                    <optgroup label="推荐风格">
-                        <option value="cartodb">浅色简洁</option>
-                        <option value="cartodb-voyager">彩色风格</option>
-                        <option value="cartodb-dark">深色风格</option>
-                    </optgroup>
-                    <optgroup label="标准地图">
-                        <option value="osm">OpenStreetMap（标准）</option>
-                        <option value="wikimedia">维基媒体地图</option>
-                        <option value="hot">人道主义地图</option>
-                    </optgroup>
-                    <optgroup label="地形图">
-                        <option value="stamen-terrain">Stamen地形图</option>
-                        <option value="esri-topo">Esri地形图</option>
-                        <option value="opentopomap">OpenTopoMap</option>
-                        <option value="esri-physical">Esri物理地图</option>
-                        <option value="esri-shaded">Esri阴影地形</option>
-                    </optgroup>
-                    <optgroup label="特殊风格">
-                        <option value="stamen-toner">黑白风格</option>
-                        <option value="stamen-watercolor">水彩风格</option>
-                        <option value="esri-gray">灰色画布</option>
-                        <option value="cyclosm">自行车友好</option>
-                    </optgroup>
-                    <optgroup label="Esri地图">
-                        <option value="esri-street">Esri街道图</option>
-                        <option value="esri-satellite">Esri卫星图</option>
-                    </optgroup>
-                    <optgroup label="其他">
-                        <option value="openmapsurfer-roads">道路地图</option>
-                        <option value="openmapsurfer-admin">行政边界</option>
-                        <option value="thunderforest-landscape">景观地图</option>
-                    </optgroup>
-                </select>
-            </div>
-            <div id="risk-map" class="map-container"></div>
-        </div>
-    '''
-    # 添加统计信息
-    risks = parsed_data['风险清单']
-    risk_levels = {}
-    risk_categories = {}
-    
-    for risk in risks:
-        level = risk['风险等级']
-        category = risk['风险类别']
-        risk_levels[level] = risk_levels.get(level, 0) + 1
-        risk_categories[category] = risk_categories.get(category, 0) + 1
-    
-    html += '''
-        <h2>3. 风险统计</h2>
-        <div class="stats">
-            <div class="stat-box">
-                <h4>总风险数</h4>
-                <div class="number">''' + str(len(risks)) + '''</div>
-            </div>
-'''
-    
-    for level, count in sorted(risk_levels.items(), key=lambda x: x[1], reverse=True):
-        html += f'''
-            <div class="stat-box">
-                <h4>{level}风险</h4>
-                <div class="number">{count}</div>
-            </div>
-'''
-    
-    html += '''
-        </div>
-        
-        <div class="stats">
-'''
-    
-    for category, count in sorted(risk_categories.items(), key=lambda x: x[1], reverse=True):
-        html += f'''
-            <div class="stat-box">
-                <h4>{category}</h4>
-                <div class="number">{count}</div>
-            </div>
-'''
-    
-    # 生成风险数据JSON
-    risk_data_json = json.dumps([{
-        '序号': r['序号'],
-        '风险名称': r['风险名称'],
-        '风险等级': r['风险等级'],
-        '地理位置': r.get('地理位置', ['未明确']),
-        '风险描述': r['风险描述']
-    } for r in parsed_data['风险清单']], ensure_ascii=False)
-    
-    # 加载坐标缓存并传递给前端
-    coordinate_cache = load_coordinate_cache()
-    coordinate_cache_json = json.dumps(coordinate_cache, ensure_ascii=False)
-    
-    # 获取动态提取的地理位置关系
-    location_relationships = parsed_data.get('地理位置关系', {})
-    location_relationships_json = json.dumps(location_relationships, ensure_ascii=False)
-    
-    html += f'''
-        </div>
-    </div>
-    
-    <script>
-        // 风险数据
-        const riskData = {risk_data_json};
-        
-        // 坐标缓存（从coordinate_cache.json加载）
-        const coordinateCache = {coordinate_cache_json};
-        
-        // 动态提取的地理位置关系（从报告文本中提取）
-        const dynamicLocationRelationships = {location_relationships_json};
-        
-        // 规范化地理位置名称（与后端保持一致）
-        function normalizeLocation(location) {{
-            // 模糊地区（应该过滤）
-            const vagueLocations = ['中部', '沿海地区', '国内', '海外', '东南亚', '广汽', '本田', '安世'];
-            if (vagueLocations.includes(location)) {{
-                return null;
+        function writeGeocodeCache(location, coords) {{
+            try {{
+                localStorage.setItem(GEOCODE_CACHE_PREFIX + location, JSON.stringify(coords));
+            }} catch (error) {{
+                // 存储失败时只保留内存缓存
             }}
-            
-            // 缩写映射
-            const abbreviationMap = {{
-                '印尼': '印度尼西亚',
-                '欧盟': '欧洲'
-            }};
-            
-            return abbreviationMap[location] || location;
         }}
         
-        // 获取坐标的函数（先查缓存，再查预设，最后调用API）
+        // 获取坐标的函数（先查缓存，再查预设和本地缓存，最后调用API）
         async function getLocationCoords(location) {{
             // 规范化地理位置
             const normalized = normalizeLocation(location);
@@ -1280,32 +1336,33 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             }}
             
             // 2. 查预设坐标（只保留规范化后的名称）
-            const presetCoords = {{
-                '荷兰': [52.1326, 5.2913],
-                '中国': [35.8617, 104.1954],
-                '日本': [36.2048, 138.2529],
-                '美国': [37.0902, -95.7129],
-                '欧洲': [50.1109, 8.6821],
-                '德国': [51.1657, 10.4515],
-                '法国': [46.2276, 2.2137],
-                '英国': [55.3781, -3.4360],
-                '澳大利亚': [-25.2744, 133.7751],
-                '韩国': [35.9078, 127.7669],
-                '印度': [20.5937, 78.9629],
-                '越南': [14.0583, 108.2772],
-                '印度尼西亚': [-0.7893, 113.9213],
-                '福岛': [37.75, 140.47],
-                '鹿儿岛': [31.5966, 130.5571],
-                '塞梅鲁': [-8.1080, 112.9225],
-                '东爪哇': [-7.5361, 112.2384],
-                '东莞': [23.0207, 113.7518],
-            }};
-            
             if (presetCoords[normalized]) {{
                 return presetCoords[normalized];
             }}
             
-            // 3. 调用Nominatim API获取坐标（使用规范化后的名称）
+            // 3. 查本地持久化的地理编码结果（之前打开报告时已查询过的地点）
+            const storedCoords = readGeocodeCache(normalized);
+            if (storedCoords) {{
+                coordinateCache[normalized] = storedCoords;
+                return storedCoords;
+            }}
+            
+            // 4. 调用Nominatim API获取坐标（同一地点同时只发起一个请求）
+            if (!pendingGeocodes.has(normalized)) {{
+                pendingGeocodes.set(normalized, geocodeLocation(normalized));
+            }}
+            const coords = await pendingGeocodes.get(normalized);
+            if (coords) {{
+                return coords;
+            }}
+            pendingGeocodes.delete(normalized); // 失败时允许下次重试
+            
+            // 默认坐标
+            return [30.0, 120.0];
+        }}
+        
+        // 调用Nominatim API获取坐标（使用规范化后的名称），成功时写入内存和本地缓存
+        async function geocodeLocation(normalized) {{
             try {{
                 const url = `https://nominatim.openstreetmap.org/search?q=${{encodeURIComponent(normalized)}}&format=json&limit=1&accept-language=zh-CN,zh,en`;
                 const response = await fetch(url, {{
@@ -1318,96 +1375,106 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                     const data = await response.json();
                     if (data && data.length > 0) {{
                         const coords = [parseFloat(data[0].lat), parseFloat(data[0].lon)];
-                        // 保存到缓存（仅内存中，不持久化，使用规范化名称）
                         coordinateCache[normalized] = coords;
+                        writeGeocodeCache(normalized, coords);
                         return coords;
                     }}
                 }}
             }} catch (error) {{
                 console.warn(`获取 ${{normalized}} 的坐标失败:`, error);
             }}
-            
-            // 默认坐标
-            return [30.0, 120.0];
+            return null;
+        }}
+        
+        // 在浏览器完成下一次布局后执行回调（代替固定延时的setTimeout，DOM就绪后立即执行）
+        function runAfterLayout(callback) {{
+            if (typeof requestAnimationFrame === 'function') {{
+                requestAnimationFrame(function() {{
+                    requestAnimationFrame(callback);
+                }});
+            }} else {{
+                setTimeout(callback, 0);
+            }}
         }}
         
+        // 视图区域和切换按钮在页面中是固定的，首次切换时查询一次后复用；
+        // 同时记录当前激活的视图和按钮，切换时只修改发生变化的两个元素
+        let viewSections = null;
+        let toggleBtns = null;
+        let activeView = null;
+        let activeBtn = null;
+        
         // 视图切换函数
         function showView(viewType, buttonElement) {{
             console.log('切换视图:', viewType); // 调试信息
             
-            // 隐藏所有视图
-            const viewSections = document.querySelectorAll('.view-section');
+            if (!viewSections || viewSections.length === 0) {{
+                viewSections = document.querySelectorAll('.view-section');
+                toggleBtns = document.querySelectorAll('.view-toggle-btn');
+                activeView = Array.prototype.find.call(viewSections, section => section.classList.contains('active')) || null;
+                activeBtn = Array.prototype.find.call(toggleBtns, btn => btn.classList.contains('active')) || null;
+            }}
+            
             if (viewSections.length === 0) {{
                 console.warn('未找到.view-section元素');
                 return;
             }}
-            viewSections.forEach(section => {{
-                section.classList.remove('active');
-            }});
-            
-            // 更新所有按钮状态
-            const toggleBtns = document.querySelectorAll('.view-toggle-btn');
-            toggleBtns.forEach(btn => {{
-                btn.classList.remove('active');
-            }});
             
-            // 显示选中的视图
+            // 查找选中的视图
             const targetView = document.getElementById(viewType + '-view');
-            if (targetView) {{
-                targetView.classList.add('active');
-                console.log('已显示视图:', viewType + '-view'); // 调试信息
-            }} else {{
+            if (!targetView) {{
                 console.warn('未找到视图元素: ' + viewType + '-view');
                 return;
             }}
             
-            // 激活被点击的按钮
-            if (buttonElement) {{
-                buttonElement.classList.add('active');
-            }} else {{
-                // 如果没有传递buttonElement，通过viewType找到对应的按钮
-                toggleBtns.forEach(btn => {{
-                    if (btn.getAttribute('data-view') === viewType) {{
-                        btn.classList.add('active');
-                    }}
-                }});
+            // 隐藏之前的视图，显示选中的视图
+            if (activeView !== targetView) {{
+                if (activeView) activeView.classList.remove('active');
+                targetView.classList.add('active');
+                activeView = targetView;
+            }}
+            console.log('已显示视图:', viewType + '-view'); // 调试信息
+            
+            // 激活被点击的按钮（如果没有传递buttonElement，通过viewType找到对应的按钮）
+            const targetBtn = buttonElement ||
+                Array.prototype.find.call(toggleBtns, btn => btn.getAttribute('data-view') === viewType) || null;
+            if (activeBtn !== targetBtn) {{
+                if (activeBtn) activeBtn.classList.remove('active');
+                if (targetBtn) targetBtn.classList.add('active');
+                activeBtn = targetBtn;
             }}
             
-            // 如果是地图视图，延迟初始化地图（确保DOM已更新）
+            // 如果是地图视图，在视图完成布局后初始化地图（确保DOM已更新）
             if (viewType === 'map') {{
-                setTimeout(function() {{
-                    initMap();
-                }}, 100);
+                runAfterLayout(initMap);
             }}
         }}
         
         // 确保函数在全局作用域中可用（用于兼容性）
         window.showView = showView;
         
-        // 使用事件监听器绑定视图切换按钮（更可靠的方式）
+        // 在按钮容器上绑定一个委托事件监听器处理所有视图切换按钮
         function initViewToggle() {{
-            const toggleBtns = document.querySelectorAll('.view-toggle-btn');
-            console.log('找到视图切换按钮数量:', toggleBtns.length); // 调试信息
+            const toggleContainer = document.querySelector('.view-toggle');
             
-            if (toggleBtns.length === 0) {{
+            if (!toggleContainer) {{
                 console.warn('未找到视图切换按钮，将在100ms后重试');
                 setTimeout(initViewToggle, 100);
                 return;
             }}
             
-            toggleBtns.forEach(btn => {{
-                // 添加事件监听器（使用once选项避免重复绑定）
-                btn.addEventListener('click', function(e) {{
-                    e.preventDefault();
-                    const viewType = this.getAttribute('data-view');
-                    console.log('按钮被点击，视图类型:', viewType); // 调试信息
-                    if (viewType) {{
-                        showView(viewType, this);
-                    }} else {{
-                        console.error('按钮缺少data-view属性');
-                    }}
-                }}, {{ once: false }});
-            }});
+            // 按钮不在表单中，点击没有默认行为需要阻止，因此使用被动监听器
+            toggleContainer.addEventListener('click', function(e) {{
+                const btn = e.target.closest('.view-toggle-btn');
+                if (!btn || !toggleContainer.contains(btn)) return;
+                const viewType = btn.getAttribute('data-view');
+                console.log('按钮被点击，视图类型:', viewType); // 调试信息
+                if (viewType) {{
+                    showView(viewType, btn);
+                }} else {{
+                    console.error('按钮缺少data-view属性');
+                }}
+            }}, {{ passive: true }});
         }}
         
         // 如果DOM已加载，立即执行；否则等待DOMContentLoaded
@@ -1419,20 +1486,16 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             }});
         }} else {{
             // DOM已经加载完成，立即执行
-            setTimeout(function() {{
-                initViewToggle();
-                // 如果地图视图是默认显示的，初始化地图
-                initMapIfNeeded();
-            }}, 0);
+            initViewToggle();
+            // 如果地图视图是默认显示的，初始化地图
+            initMapIfNeeded();
         }}
         
         // 检查是否需要初始化地图（如果地图视图是默认显示的）
         function initMapIfNeeded() {{
             const mapView = document.getElementById('map-view');
             if (mapView && mapView.classList.contains('active')) {{
-                setTimeout(function() {{
-                    initMap();
-                }}, 200); // 延迟一点确保DOM完全渲染
+                runAfterLayout(initMap); // 等待布局完成，确保地图容器尺寸正确
             }}
         }}
         
@@ -1451,8 +1514,8 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                 return;
             }}
             
-            // 创建地图
-            const map = L.map('risk-map').setView([30, 120], 3);
+            // 创建地图（矢量图层使用Canvas渲染：国家边界和连线绘制在同一个画布上，不再为每条路径创建SVG节点）
+            const map = L.map('risk-map', {{ preferCanvas: true }}).setView([30, 120], 3);
             
             // 地图样式配置（可以选择不同的地图背景）
             const mapStyles = {{
@@ -1820,122 +1883,190 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             const legend = L.control({{position: 'bottomright'}});
             legend.onAdd = function(map) {{
                 const div = L.DomUtil.create('div', 'map-legend');
-                div.style.backgroundColor = 'white';
-                div.style.padding = '10px';
-                div.style.borderRadius = '5px';
-                div.style.boxShadow = '0 2px 8px rgba(0,0,0,0.2)';
-                div.style.fontFamily = "'Microsoft YaHei', sans-serif";
-                div.style.fontSize = '12px';
                 div.innerHTML = `
-                    <div style="font-weight: bold; margin-bottom: 8px; color: #2c3e50;">风险等级</div>
-                    <div style="display: flex; align-items: center; margin: 5px 0;">
-                        <div style="width: 12px; height: 12px; border-radius: 50%; background: #e74c3c; border: 2px solid #fff; margin-right: 8px;"></div>
-                        <span>高风险</span>
-                    </div>
-                    <div style="display: flex; align-items: center; margin: 5px 0;">
-                        <div style="width: 10px; height: 10px; border-radius: 50%; background: #f39c12; border: 2px solid #fff; margin-right: 8px;"></div>
-                        <span>中风险</span>
-                    </div>
-                    <div style="display: flex; align-items: center; margin: 5px 0;">
-                        <div style="width: 8px; height: 8px; border-radius: 50%; background: #27ae60; border: 2px solid #fff; margin-right: 8px;"></div>
-                        <span>低风险</span>
+                    <div class="map-legend-title">风险等级</div>
+                    <div class="map-legend-item"><span class="map-legend-dot high"></span><span>高风险</span></div>
+                    <div class="map-legend-item"><span class="map-legend-dot medium"></span><span>中风险</span></div>
+                    <div class="map-legend-item"><span class="map-legend-dot low"></span><span>低风险</span></div>
                 `;
                 return div;
             }};
             legend.addTo(map);
             
-            // 获取单个国家的GeoJSON边界数据（借鉴main.py的实现方式）
+            // 使用多个可靠的GeoJSON数据源（借鉴main.py，优先使用阿里云Datav）
+            const geojsonUrls = [
+                'https://geo.datav.aliyun.com/areas_v3/bound/geojson?code=all',
+                'https://geo.datav.aliyun.com/areas/bound/geojson?code=all',
+                'https://raw.githubusercontent.com/datasets/geo-boundaries-world-110m/master/countries.geojson',
+                'https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson',
+                'https://raw.githubusercontent.com/holtzy/D3-graph-gallery/master/DATA/world.geojson',
+                'https://raw.githubusercontent.com/johan/world.geo.json/master/countries.geo.json'
+            ];
+            
+            // 用于匹配国家名称的GeoJSON属性字段
+            const featureNameKeys = ['NAME', 'NAME_LONG', 'NAME_EN', 'name', 'NAME_ISO', 'ISO_A3', 'ADMIN', 'admin', 'ISO_A3_EH', 'ADM0_A3'];
+            
+            // 遍历一次所有要素，建立 名称 -> 要素 的索引（同名时保留第一个要素）
+            function buildFeatureIndex(worldGeoJson) {{
+                const index = new Map();
+                for (const feature of worldGeoJson.features || []) {{
+                    const props = feature.properties || {{}};
+                    for (const key of featureNameKeys) {{
+                        const value = props[key];
+                        if (value && !index.has(value)) {{
+                            index.set(value, feature);
+                        }}
+                    }}
+                }}
+                return index;
+            }}
+            
+            // 世界GeoJSON索引缓存（URL -> Promise<Map>），每个数据源在页面生命周期内只下载、解析和建索引一次，
+            // 所有国家共享同一份结果（包括同时加载的国家）。
+            // 只由 searchCountryGeoJSON 按优先级逐个调用：前一个数据源失败或未命中时才会请求下一个，
+            // 不要在此之外预先请求全部数据源（备用数据源中有体积很大的世界边界文件）
+            const worldGeoJsonCache = new Map();
+            
+            function fetchWorldGeoJSON(url) {{
+                if (!worldGeoJsonCache.has(url)) {{
+                    worldGeoJsonCache.set(url,
+                        // 不设置自定义请求头，避免触发CORS预检请求（多一次往返）；
+                        // force-cache 让再次打开页面时直接复用浏览器HTTP缓存中的世界GeoJSON
+                        fetch(url, {{ cache: 'force-cache' }})
+                            .then(response => response.ok ? response.json() : null)
+                            .then(worldGeoJson => worldGeoJson ? buildFeatureIndex(worldGeoJson) : null)
+                            .catch(() => null)
+                    );
+                }}
+                return worldGeoJsonCache.get(url);
+            }}
+            
+            // 国家边界的本地持久化缓存（localStorage），再次打开报告时无需重新下载世界GeoJSON
+            const COUNTRY_CACHE_TTL = 7 * 24 * 60 * 60 * 1000; // 7天
+            
+            // 简单的字符串哈希（djb2），数据源列表变化时缓存自动失效
+            function hashString(str) {{
+                let hash = 5381;
+                for (let i = 0; i < str.length; i++) {{
+                    hash = ((hash << 5) + hash + str.charCodeAt(i)) | 0;
+                }}
+                return (hash >>> 0).toString(16);
+            }}
+            
+            const geojsonUrlsHash = hashString(geojsonUrls.join(','));
+            
+            function countryCacheKey(countryNameEn) {{
+                return `scrv_country_${{countryNameEn}}_${{geojsonUrlsHash}}`;
+            }}
+            
+            function readCountryCache(countryNameEn) {{
+                try {{
+                    const raw = localStorage.getItem(countryCacheKey(countryNameEn));
+                    if (!raw) return null;
+                    const entry = JSON.parse(raw);
+                    if (Date.now() - entry.time < COUNTRY_CACHE_TTL) {{
+                        return entry.feature;
+                    }}
+                    localStorage.removeItem(countryCacheKey(countryNameEn));
+                }} catch (error) {{
+                    // localStorage不可用（隐私模式等）或数据损坏，忽略缓存
+                }}
+                return null;
+            }}
+            
+            function writeCountryCache(countryNameEn, feature) {{
+                try {{
+                    localStorage.setItem(countryCacheKey(countryNameEn), JSON.stringify({{ time: Date.now(), feature: feature }}));
+                }} catch (error) {{
+                    // 超出存储配额等情况下不缓存，不影响显示
+                }}
+            }}
+            
+            // 获取单个国家的GeoJSON边界数据，优先使用本地缓存
             async function loadCountryGeoJSON(countryNameEn) {{
-                // 国家名称的多种可能匹配方式
-                const nameVariants = {{
-                    'Netherlands': ['Netherlands', 'The Netherlands', 'NLD', 'Holland'],
-                    'China': ['China', "People's Republic of China", 'CHN', 'PRC'],
-                    'Japan': ['Japan', 'JPN'],
-                    'United States of America': ['United States of America', 'United States', 'USA', 'US'],
-                    'Germany': ['Germany', 'DEU', 'DE'],
-                    'France': ['France', 'FRA', 'FR'],
-                    'United Kingdom': ['United Kingdom', 'UK', 'GBR', 'GB'],
-                    'Australia': ['Australia', 'AUS', 'AU'],
-                    'South Korea': ['South Korea', 'Korea', 'KOR', 'KR'],
-                    'India': ['India', 'IND', 'IN'],
-                    'Vietnam': ['Vietnam', 'VNM', 'VN'],
-                    'Indonesia': ['Indonesia', 'IDN', 'ID']
-                }};
-                
-                // 台湾的各种可能名称（用于合并到中国）
-                const taiwanVariants = ['Taiwan', 'Taiwan, Province of China', 'Republic of China', 'TWN', 'TW'];
+                const cached = readCountryCache(countryNameEn);
+                if (cached) {{
+                    return cached;
+                }}
                 
+                const feature = await searchCountryGeoJSON(countryNameEn);
+                if (feature) {{
+                    writeCountryCache(countryNameEn, feature);
+                }}
+                return feature;
+            }}
+            
+            // 国家名称的多种可能匹配方式（只构建一次，所有国家共享）
+            const nameVariants = {{
+                'Netherlands': ['Netherlands', 'The Netherlands', 'NLD', 'Holland'],
+                'China': ['China', "People's Republic of China", 'CHN', 'PRC'],
+                'Japan': ['Japan', 'JPN'],
+                'United States of America': ['United States of America', 'United States', 'USA', 'US'],
+                'Germany': ['Germany', 'DEU', 'DE'],
+                'France': ['France', 'FRA', 'FR'],
+                'United Kingdom': ['United Kingdom', 'UK', 'GBR', 'GB'],
+                'Australia': ['Australia', 'AUS', 'AU'],
+                'South Korea': ['South Korea', 'Korea', 'KOR', 'KR'],
+                'India': ['India', 'IND', 'IN'],
+                'Vietnam': ['Vietnam', 'VNM', 'VN'],
+                'Indonesia': ['Indonesia', 'IDN', 'ID']
+            }};
+            
+            // 台湾的各种可能名称（用于合并到中国）
+            const taiwanVariants = ['Taiwan', 'Taiwan, Province of China', 'Republic of China', 'TWN', 'TW'];
+            
+            // 坐标保留5位小数（约1米精度），减小缓存体积和后续解析、绘制的数据量
+            function roundCoordinates(coords) {{
+                if (typeof coords[0] === 'number') {{
+                    return coords.map(value => Math.round(value * 1e5) / 1e5);
+                }}
+                return coords.map(roundCoordinates);
+            }}
+            
+            function compactGeometry(geometry) {{
+                if (!geometry || !Array.isArray(geometry.coordinates)) return geometry || {{}};
+                return {{ type: geometry.type, coordinates: roundCoordinates(geometry.coordinates) }};
+            }}
+            
+            // 按名称变体的优先级顺序在要素索引中查找，返回第一个匹配的要素
+            function findFeature(featureIndex, variants) {{
+                for (const variant of variants) {{
+                    const feature = featureIndex.get(variant);
+                    if (feature) return feature;
+                }}
+                return null;
+            }}
+            
+            // 从世界GeoJSON数据源中查找单个国家的边界（借鉴main.py的实现方式）
+            async function searchCountryGeoJSON(countryNameEn) {{
                 const countryVariants = nameVariants[countryNameEn] || [countryNameEn];
                 
-                // 使用多个可靠的GeoJSON数据源（借鉴main.py，优先使用阿里云Datav）
-                const geojsonUrls = [
-                    'https://geo.datav.aliyun.com/areas_v3/bound/geojson?code=all',
-                    'https://geo.datav.aliyun.com/areas/bound/geojson?code=all',
-                    'https://raw.githubusercontent.com/datasets/geo-boundaries-world-110m/master/countries.geojson',
-                    'https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson',
-                    'https://raw.githubusercontent.com/holtzy/D3-graph-gallery/master/DATA/world.geojson',
-                    'https://raw.githubusercontent.com/johan/world.geo.json/master/countries.geo.json'
-                ];
-                
+                // 按优先级逐个尝试数据源（已缓存的直接复用），当前数据源失败或未找到该国家时才请求下一个，
+                // 避免在首选数据源已命中时仍下载体积很大的备用数据源
                 for (const url of geojsonUrls) {{
                     try {{
-                        const response = await fetch(url, {{
-                            headers: {{
-                                'User-Agent': 'SupplyChainRiskVisualization/1.0'
-                            }}
-                        }});
+                        const featureIndex = await fetchWorldGeoJSON(url);
                         
-                        if (response.ok) {{
-                            const worldGeoJson = await response.json();
-                            let mainFeature = null;
-                            let taiwanFeature = null;
+                        if (featureIndex) {{
+                            // 按名称索引直接查找指定国家
+                            const mainFeature = findFeature(featureIndex, countryVariants);
                             
-                            // 在GeoJSON中查找指定国家
-                            for (const feature of worldGeoJson.features || []) {{
-                                const props = feature.properties || {{}};
-                                
-                                // 查找主国家
-                                if (!mainFeature) {{
-                                    for (const variant of countryVariants) {{
-                                        if (props.NAME === variant || 
-                                            props.NAME_LONG === variant ||
-                                            props.NAME_EN === variant ||
-                                            props.name === variant ||
-                                            props.NAME_ISO === variant ||
-                                            props.ISO_A3 === variant ||
-                                            props.ADMIN === variant ||
-                                            props.admin === variant ||
-                                            props.ISO_A3_EH === variant ||
-                                            props.ADM0_A3 === variant) {{
-                                            mainFeature = feature;
-                                            break;
-                                        }}
-                                    }}
-                                }}
-                                
-                                // 如果是中国，同时查找台湾
-                                if (countryNameEn === 'China' && !taiwanFeature) {{
-                                    for (const variant of taiwanVariants) {{
-                                        if (props.NAME === variant || 
-                                            props.NAME_LONG === variant ||
-                                            props.NAME_EN === variant ||
-                                            props.name === variant ||
-                                            props.ISO_A3 === variant ||
-                                            props.ADMIN === variant) {{
-                                            taiwanFeature = feature;
-                                            break;
-                                        }}
-                                    }}
-                                }}
-                            }}
+                            // 如果是中国，同时在同一份索引中查找台湾
+                            const taiwanFeature = countryNameEn === 'China' ? findFeature(featureIndex, taiwanVariants) : null;
                             
                             // 如果找到主国家，尝试合并台湾（针对中国）
                             if (mainFeature) {{
+                                // 只保留几何数据和国家名称，去掉数据源中几十个用不到的属性
+                                //（减小localStorage缓存体积，也避免修改缓存中共享的原始要素）
                                 if (countryNameEn === 'China' && taiwanFeature) {{
-                                    // 合并中国和台湾的几何数据
-                                    const mergedFeature = JSON.parse(JSON.stringify(mainFeature));
-                                    const mainGeom = mergedFeature.geometry || {{}};
-                                    const taiwanGeom = taiwanFeature.geometry || {{}};
+                                    // 合并中国和台湾的几何数据（compactGeometry生成新数组，不修改共享的原始要素）
+                                    const mergedFeature = {{
+                                        type: 'Feature',
+                                        properties: {{ name: countryNameEn }},
+                                        geometry: compactGeometry(mainFeature.geometry)
+                                    }};
+                                    const mainGeom = mergedFeature.geometry;
+                                    const taiwanGeom = compactGeometry(taiwanFeature.geometry);
                                     
                                     // 如果主几何是Polygon，转换为MultiPolygon
                                     if (mainGeom.type === 'Polygon') {{
@@ -1954,7 +2085,11 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                                     
                                     return mergedFeature;
                                 }} else {{
-                                    return mainFeature;
+                                    return {{
+                                        type: 'Feature',
+                                        properties: {{ name: countryNameEn }},
+                                        geometry: compactGeometry(mainFeature.geometry)
+                                    }};
                                 }}
                             }}
                         }}
@@ -1966,6 +2101,46 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                 return null;
             }}
             
+            // 国家高亮样式：根据风险等级设置透明度和边框宽度（借鉴main.py），只构建一次
+            const countryHighlightStyles = {{}};
+            [['高', 0.15, 3], ['中', 0.12, 2.5], ['低', 0.1, 2]].forEach(([level, fillOpacity, weight]) => {{
+                const color = levelColors[level] || '#95a5a6';
+                countryHighlightStyles[level] = {{
+                    fillColor: color,
+                    fillOpacity: fillOpacity,
+                    color: color,
+                    weight: weight,
+                    opacity: 1.0
+                }};
+            }});
+            
+            // 根据要素属性构建国家弹窗内容（首次打开弹窗时调用）
+            function buildCountryPopup(props) {{
+                const highlightColor = levelColors[props.riskLevel] || '#95a5a6';
+                const html = [
+                    `<div style="font-family: 'Microsoft YaHei', sans-serif; max-width: 300px;">`,
+                    `<h4 style="margin: 0 0 8px 0; color: ${{highlightColor}};">${{props.countryName}}</h4>`,
+                    `<p style="margin: 5px 0;"><strong>风险事件数：</strong>${{props.riskCount}}</p>`,
+                    `<p style="margin: 5px 0;"><strong>最高风险等级：</strong><span style="color: ${{highlightColor}};">${{props.riskLevel}}</span></p>`
+                ];
+                
+                if (props.risks.length > 0) {{
+                    html.push('<hr style="margin: 8px 0; border: none; border-top: 1px solid #ddd;">');
+                    props.risks.forEach(risk => {{
+                        const riskColor = levelColors[risk['风险等级']] || '#95a5a6';
+                        html.push(
+                            `<div style="margin-bottom: 8px; padding: 6px; background: #f8f9fa; border-radius: 4px; border-left: 3px solid ${{riskColor}};">`,
+                            `<div style="font-weight: 600; color: ${{riskColor}}; font-size: 12px; margin-bottom: 2px;">${{risk['风险名称'] || '未知风险'}}</div>`,
+                            `<div style="font-size: 11px; color: #666;">${{risk['风险描述'] ? risk['风险描述'].substring(0, 50) + '...' : '无描述'}}</div>`,
+                            '</div>'
+                        );
+                    }});
+                }}
+                
+                html.push('</div>');
+                return html.join('');
+            }}
+            
             // 获取国家边界GeoJSON并高亮显示
             async function highlightCountries(countries) {{
                 if (!countries || countries.length === 0) return;
@@ -1985,115 +2160,86 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                 
                 if (countriesToHighlight.size === 0) return;
                 
-                // 为每个国家加载GeoJSON并高亮
-                const highlightPromises = Array.from(countriesToHighlight).map(async (countryName) => {{
+                // 先为所有国家发起边界数据加载（网络请求并发进行），再在等待期间统计风险
+                const countryList = Array.from(countriesToHighlight);
+                const featurePromises = countryList.map(countryName => loadCountryGeoJSON(countryNameMapping[countryName]));
+                
+                // 一次遍历风险数据，计算每个国家的最高风险等级和风险数量
+                const countryStats = new Map();
+                countryList.forEach(countryName => {{
+                    countryStats.set(countryName, {{ maxRiskLevel: '低', riskCount: 0, countryRisks: [] }});
+                }});
+                
+                riskData.forEach(risk => {{
+                    const riskLocations = risk['地理位置'] || [];
+                    const riskLocationsArray = typeof riskLocations === 'string' 
+                        ? riskLocations.split(',').map(l => l.trim())
+                        : riskLocations;
+                    
+                    // 该风险涉及的国家（包括规范化后的名称和地区映射）
+                    const riskCountries = new Set();
+                    riskLocationsArray.forEach(loc => {{
+                        const normalized = normalizeLocation(loc);
+                        if (!normalized) return;
+                        riskCountries.add(normalized);
+                        const mappedCountry = getCountryFromLocation(normalized);
+                        if (mappedCountry) {{
+                            riskCountries.add(mappedCountry);
+                        }}
+                    }});
+                    
+                    const level = risk['风险等级'] || '低';
+                    riskCountries.forEach(countryName => {{
+                        const stats = countryStats.get(countryName);
+                        if (!stats) return;
+                        stats.riskCount++;
+                        stats.countryRisks.push(risk);
+                        if (level === '高') {{
+                            stats.maxRiskLevel = '高';
+                        }} else if (level === '中' && stats.maxRiskLevel !== '高') {{
+                            stats.maxRiskLevel = '中';
+                        }}
+                    }});
+                }});
+                
+                const highlightPromises = countryList.map(async (countryName, i) => {{
                     const countryNameEn = countryNameMapping[countryName];
-                    if (!countryNameEn) return;
                     
-                    // 加载国家边界GeoJSON数据
-                    const countryFeature = await loadCountryGeoJSON(countryNameEn);
+                    // 等待国家边界GeoJSON数据
+                    const countryFeature = await featurePromises[i];
                     
                     if (!countryFeature) {{
                         console.warn(`未找到 ${{countryName}} (${{countryNameEn}}) 的GeoJSON边界数据`);
                         return;
                     }}
                     
-                    // 计算该国家的最高风险等级和风险数量
-                    let maxRiskLevel = '低';
-                    let riskCount = 0;
-                    const countryRisks = [];
-                    
-                    riskData.forEach(risk => {{
-                        const riskLocations = risk['地理位置'] || [];
-                        const riskLocationsArray = typeof riskLocations === 'string' 
-                            ? riskLocations.split(',').map(l => l.trim())
-                            : riskLocations;
-                        
-                        // 检查是否包含该国家（包括规范化后的名称和地区映射）
-                        const normalizedLocations = riskLocationsArray.map(loc => normalizeLocation(loc)).filter(Boolean);
-                        let belongsToCountry = false;
-                        
-                        // 直接检查是否包含该国家
-                        if (normalizedLocations.includes(countryName)) {{
-                            belongsToCountry = true;
-                        }} else {{
-                            // 检查是否有地区映射到该国家
-                            normalizedLocations.forEach(loc => {{
-                                const mappedCountry = getCountryFromLocation(loc);
-                                if (mappedCountry === countryName) {{
-                                    belongsToCountry = true;
-                                }}
-                            }});
-                        }}
-                        
-                        if (belongsToCountry) {{
-                            riskCount++;
-                            countryRisks.push(risk);
-                            const level = risk['风险等级'] || '低';
-                            if (level === '高') {{
-                                maxRiskLevel = '高';
-                            }} else if (level === '中' && maxRiskLevel !== '高') {{
-                                maxRiskLevel = '中';
-                            }}
-                        }}
-                    }});
-                    
-                    const highlightColor = levelColors[maxRiskLevel] || '#95a5a6';
-                    
-                    // 根据风险等级设置透明度和边框宽度（借鉴main.py）
-                    let fillOpacity, borderOpacity, weight;
-                    if (maxRiskLevel === '高') {{
-                        fillOpacity = 0.15;
-                        borderOpacity = 1.0;
-                        weight = 3;
-                    }} else if (maxRiskLevel === '中') {{
-                        fillOpacity = 0.12;
-                        borderOpacity = 1.0;
-                        weight = 2.5;
-                    }} else {{
-                        fillOpacity = 0.1;
-                        borderOpacity = 1.0;
-                        weight = 2;
-                    }}
+                    const {{ maxRiskLevel, riskCount, countryRisks }} = countryStats.get(countryName);
                     
-                    // 创建高亮层
-                    const highlightLayer = L.geoJSON(countryFeature, {{
-                        style: {{
-                            fillColor: highlightColor,
-                            fillOpacity: fillOpacity,
-                            color: highlightColor,
-                            weight: weight,
-                            opacity: borderOpacity
+                    // 只取几何数据，不修改缓存中共享的原始要素；样式和弹窗所需信息放入properties，
+                    // 弹窗HTML在用户点击时才生成
+                    return {{
+                        type: 'Feature',
+                        geometry: countryFeature.geometry,
+                        properties: {{
+                            countryName: countryName,
+                            riskLevel: maxRiskLevel,
+                            riskCount: riskCount,
+                            risks: countryRisks
                         }}
-                    }}).addTo(map);
-                    
-                    // 构建弹窗内容
-                    let popupContent = `
-                        <div style="font-family: 'Microsoft YaHei', sans-serif; max-width: 300px;">
-                            <h4 style="margin: 0 0 8px 0; color: ${{highlightColor}};">${{countryName}}</h4>
-                            <p style="margin: 5px 0;"><strong>风险事件数：</strong>${{riskCount}}</p>
-                            <p style="margin: 5px 0;"><strong>最高风险等级：</strong><span style="color: ${{highlightColor}};">${{maxRiskLevel}}</span></p>
-                    `;
-                    
-                    if (countryRisks.length > 0) {{
-                        popupContent += '<hr style="margin: 8px 0; border: none; border-top: 1px solid #ddd;">';
-                        countryRisks.forEach(risk => {{
-                            const riskColor = levelColors[risk['风险等级']] || '#95a5a6';
-                            popupContent += `
-                                <div style="margin-bottom: 8px; padding: 6px; background: #f8f9fa; border-radius: 4px; border-left: 3px solid ${{riskColor}};">
-                                    <div style="font-weight: 600; color: ${{riskColor}}; font-size: 12px; margin-bottom: 2px;">${{risk['风险名称'] || '未知风险'}}</div>
-                                    <div style="font-size: 11px; color: #666;">${{risk['风险描述'] ? risk['风险描述'].substring(0, 50) + '...' : '无描述'}}</div>
-                                </div>
-                            `;
-                        }});
-                    }}
-                    
-                    popupContent += '</div>';
-                    highlightLayer.bindPopup(popupContent);
+                    }};
                 }});
                 
-                // 等待所有国家高亮完成
-                await Promise.all(highlightPromises);
+                // 等待所有国家加载完成，合并为一个FeatureCollection，只创建一个高亮图层
+                const features = (await Promise.all(highlightPromises)).filter(Boolean);
+                if (features.length === 0) return;
+                
+                L.geoJSON({{ type: 'FeatureCollection', features: features }}, {{
+                    // 样式对象按风险等级预先构建，各国家共享
+                    style: feature => countryHighlightStyles[feature.properties.riskLevel] || countryHighlightStyles['低'],
+                    // 按当前缩放级别简化边界折线，减少需要绘制的顶点数
+                    smoothFactor: {MAP_SIMPLIFY_TOLERANCE},
+                    onEachFeature: (feature, layer) => layer.bindPopup(() => buildCountryPopup(feature.properties))
+                }}).addTo(map);
             }}
             
             // 添加风险标记（按地理位置分组，多地理位置用箭头连接）
@@ -2376,35 +2522,350 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                         const group = new L.featureGroup(markers);
                         map.fitBounds(group.getBounds().pad(0.1));
                     }}
-                }});
-            }} else {{
-                console.error('riskData不是数组格式:', riskData);
-            }}
-        }}
+                }});
+            }} else {{
+                console.error('riskData不是数组格式:', riskData);
+            }}
+        }}
+        
+        // 滚动到详情（修复seq参数未使用+增加元素判空）
+        function scrollToDetail(seq) {{
+            // 根据seq找到对应的详情元素（假设seq是风险的序号，对应DOM的data-seq属性）
+            const detailSection = document.querySelector(`.risk-detail h4[data-seq="${{seq}}"]`);
+            if (detailSection) {{
+                detailSection.scrollIntoView({{ behavior: 'smooth', block: 'start' }}); 
+            }} else {{
+                console.warn(`未找到序号为${{seq}}的风险详情`); 
+            }}
+        }}
+        
+        // 确保函数在全局作用域中可用（用于onclick属性）
+        window.scrollToDetail = scrollToDetail;
+        
+    </script>
+</body>
+</html>
+''')
+_REPORT_SCRIPT_BYTES = _REPORT_SCRIPT_HTML.encode('utf-8')
+
+# 本模块源码的摘要（模板或脚本逻辑变化时，已生成的报告自动失效）
+with open(os.path.abspath(__file__), 'rb') as _source_file:
+    _MODULE_DIGEST = hashlib.blake2b(_source_file.read(), digest_size=16).hexdigest()
+
+# 已生成报告第二行中记录的内容摘要
+_REPORT_KEY_RE = re.compile(r'<!-- report-key: ([0-9a-f]+) -->')
+
+def _report_cache_key(parsed_data: Dict, coordinate_cache: Dict, precompress: bool) -> str:
+    """计算报告内容摘要：解析结果、坐标缓存、生成选项和模块源码均未变化时摘要不变"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_MODULE_DIGEST.encode('ascii'))
+    digest.update(_dumps_json(parsed_data).encode('utf-8'))
+    digest.update(_dumps_json(coordinate_cache).encode('utf-8'))
+    digest.update(b'1' if precompress else b'0')
+    return digest.hexdigest()
+
+def _read_report_key(output_file: str) -> Optional[str]:
+    """读取已生成报告中记录的内容摘要（只读前两行），不存在时返回None"""
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            f.readline()
+            match = _REPORT_KEY_RE.match(f.readline())
+    except (OSError, UnicodeDecodeError):
+        return None
+    return match.group(1) if match else None
+
+def generate_html_report(parsed_data: Dict, output_file: str, coordinate_cache: Optional[Dict] = None,
+                         precompress: bool = False):
+    """
+    生成HTML格式的报告
+    
+    参数:
+        parsed_data: 解析后的报告数据
+        output_file: 输出HTML文件路径
+        coordinate_cache: 已加载的坐标缓存；为None时从缓存文件读取（批量生成时复用，避免重复读取）
+        precompress: 是否同时生成.gz/.br预压缩文件
+    """
+    # 加载坐标缓存并传递给前端
+    if coordinate_cache is None:
+        coordinate_cache = load_coordinate_cache()
+    
+    # 内容未变化且输出文件（以及需要的全部预压缩副本）已存在时跳过重新生成
+    report_key = _report_cache_key(parsed_data, coordinate_cache, precompress)
+    if _read_report_key(output_file) == report_key and (
+            not precompress or
+            all(os.path.exists(output_file + suffix) for suffix in _precompressed_suffixes())):
+        print(f"✓ HTML报告未变化，跳过生成: {output_file}")
+        return
+    
+    # 需要重新生成时，先删除旧的.gz/.br（无论本次是否预压缩），再替换HTML：
+    # 避免静态服务器返回旧内容，也避免预压缩中途失败后，下次运行因摘要匹配而保留旧的副本
+    _remove_precompressed(output_file)
+    
+    # 分段收集HTML片段，最后一次性写入
+    parts = [f'''<!DOCTYPE html>
+<!-- report-key: {report_key} -->
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{parsed_data['标题'] or '风险报告'}</title>
+    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
+    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
+    {_REPORT_CSS_HTML}
+</head>
+<body>
+    <div class="container">
+        <h1>{parsed_data['标题'] or '风险报告'}</h1>
+        
+        <div class="meta">
+            <span>作者: {parsed_data['作者'] or '未知'}</span>
+            <span>日期: {parsed_data['日期'] or '未知'}</span>
+        </div>
+        
+        <h2>1. 风险速览</h2>
+''']
+    
+    # 添加风险速览（使用markdown渲染）
+    if parsed_data['风险速览']:
+        # 将markdown内容转换为JSON字符串以便安全嵌入HTML
+        summary_markdown = _dumps_json(parsed_data['风险速览'])
+        parts.append(f'''
+        <div class="summary">
+            <div class="markdown-content" id="risk-summary-content"></div>
+            <script>
+                (function() {{
+                    const summaryMarkdown = {summary_markdown};
+                    const summaryContent = document.getElementById('risk-summary-content');
+                    if (summaryContent && typeof marked !== 'undefined') {{
+                        summaryContent.innerHTML = marked.parse(summaryMarkdown);
+                    }} else if (summaryContent) {{
+                        // 如果marked库未加载，显示原始文本
+                        summaryContent.textContent = summaryMarkdown;
+                    }}
+                }})();
+            </script>
+        </div>
+''')
+    
+    parts.append('''
+        <div class="section-header">
+            <h2>2. 风险清单</h2>
+            <div class="view-toggle">
+                <button data-view="table" class="view-toggle-btn">表格视图</button>
+                <button data-view="cards" class="view-toggle-btn">卡片视图</button>
+                <button data-view="map" class="view-toggle-btn active">地图视图</button>
+            </div>
+        </div>
         
-        // 滚动到详情（修复seq参数未使用+增加元素判空）
-        function scrollToDetail(seq) {{
-            // 根据seq找到对应的详情元素（假设seq是风险的序号，对应DOM的data-seq属性）
-            const detailSection = document.querySelector(`.risk-detail h4[data-seq="${{seq}}"]`);
-            if (detailSection) {{
-                detailSection.scrollIntoView({{ behavior: 'smooth', block: 'start' }}); 
-            }} else {{
-                console.warn(`未找到序号为${{seq}}的风险详情`); 
-            }}
-        }}
+        <div id="table-view" class="view-section">
+            <table>
+                <thead>
+                    <tr>
+                        <th>序号</th>
+                        <th>风险名称</th>
+                        <th>风险类别</th>
+                        <th>风险等级</th>
+                        <th>地理位置</th>
+                        <th>风险描述</th>
+                    </tr>
+                </thead>
+                <tbody>
+''')
+    
+    # 添加风险清单表格行
+    for risk in parsed_data['风险清单']:
+        level_class = _TABLE_LEVEL_CLASSES.get(risk['风险等级'], '')
+        locations = risk.get('地理位置', ['未明确'])
+        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
+        parts.append(f'''
+                <tr>
+                    <td>{risk['序号']}</td>
+                    <td>{risk['风险名称']}</td>
+                    <td>{risk['风险类别']}</td>
+                    <td class="{level_class}">{risk['风险等级']}</td>
+                    <td>{location_html}</td>
+                    <td>{risk['风险描述']}</td>
+                </tr>
+''')
+    
+    parts.append('''
+            </tbody>
+        </table>
+        </div>
         
-        // 确保函数在全局作用域中可用（用于onclick属性）
-        window.scrollToDetail = scrollToDetail;
+        <div id="cards-view" class="view-section">
+            <div class="risk-cards">
+''')
+    
+    # 添加风险卡片
+    for risk in parsed_data['风险清单']:
+        level_class = _CARD_LEVEL_CLASSES.get(risk['风险等级'].lower(), 'medium')
+        locations = risk.get('地理位置', ['未明确'])
+        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
+        parts.append(f'''
+                <div class="risk-card {level_class}" onclick="scrollToDetail({risk['序号']})">
+                    <h4>{risk['风险名称']}</h4>
+                    <div>
+                        <span class="level {level_class}">{risk['风险等级']}风险</span>
+                    </div>
+                    <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
+                        <strong>类别：</strong>{risk['风险类别']}
+                    </p>
+                    <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
+                        <strong>地理位置：</strong>{location_html}
+                    </p>
+                    <p style="color: #555; font-size: 14px; margin-top: 10px;">
+                        {risk['风险描述'][:80]}{'...' if len(risk['风险描述']) > 80 else ''}
+                    </p>
+                </div>
+''')
+    
+    parts.append('''
+            </div>
+        </div>
+        
+        <div id="map-view" class="view-section active">
+            <div style="margin-bottom: 10px; display: flex; align-items: center; gap: 10px;">
+                <label for="map-style-selector" style="font-size: 14px; color: #555; font-weight: 500;">地图样式：</label>
+                <select id="map-style-selector" style="padding: 6px 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; background: white; cursor: pointer; min-width: 200px;">
+                    <optgroup label="⭐ 准确地图（推荐）">
+                        <option value="osm-china">OpenStreetMap中国</option>
+                        <option value="amap-normal">高德地图</option>
+                        <option value="tencent-normal">腾讯地图</option>
+                    </optgroup>
+                    <optgroup label="推荐风格">
+                        <option value="cartodb">浅色简洁</option>
+                        <option value="cartodb-voyager">彩色风格</option>
+                        <option value="cartodb-dark">深色风格</option>
+                    </optgroup>
+                    <optgroup label="标准地图">
+                        <option value="osm">OpenStreetMap（标准）</option>
+                        <option value="wikimedia">维基媒体地图</option>
+                        <option value="hot">人道主义地图</option>
+                    </optgroup>
+                    <optgroup label="地形图">
+                        <option value="stamen-terrain">Stamen地形图</option>
+                        <option value="esri-topo">Esri地形图</option>
+                        <option value="opentopomap">OpenTopoMap</option>
+                        <option value="esri-physical">Esri物理地图</option>
+                        <option value="esri-shaded">Esri阴影地形</option>
+                    </optgroup>
+                    <optgroup label="特殊风格">
+                        <option value="stamen-toner">黑白风格</option>
+                        <option value="stamen-watercolor">水彩风格</option>
+                        <option value="esri-gray">灰色画布</option>
+                        <option value="cyclosm">自行车友好</option>
+                    </optgroup>
+                    <optgroup label="Esri地图">
+                        <option value="esri-street">Esri街道图</option>
+                        <option value="esri-satellite">Esri卫星图</option>
+                    </optgroup>
+                    <optgroup label="其他">
+                        <option value="openmapsurfer-roads">道路地图</option>
+                        <option value="openmapsurfer-admin">行政边界</option>
+                        <option value="thunderforest-landscape">景观地图</option>
+                    </optgroup>
+                </select>
+            </div>
+            <div id="risk-map" class="map-container"></div>
+        </div>
+    ''')
+    # 添加统计信息
+    risks = parsed_data['风险清单']
+    risk_levels = {}
+    risk_categories = {}
+    
+    for risk in risks:
+        level = risk['风险等级']
+        category = risk['风险类别']
+        risk_levels[level] = risk_levels.get(level, 0) + 1
+        risk_categories[category] = risk_categories.get(category, 0) + 1
+    
+    parts.append('''
+        <h2>3. 风险统计</h2>
+        <div class="stats">
+            <div class="stat-box">
+                <h4>总风险数</h4>
+                <div class="number">''' + str(len(risks)) + '''</div>
+            </div>
+''')
+    
+    for level, count in sorted(risk_levels.items(), key=lambda x: x[1], reverse=True):
+        parts.append(f'''
+            <div class="stat-box">
+                <h4>{level}风险</h4>
+                <div class="number">{count}</div>
+            </div>
+''')
+    
+    parts.append('''
+        </div>
+        
+        <div class="stats">
+''')
+    
+    for category, count in sorted(risk_categories.items(), key=lambda x: x[1], reverse=True):
+        parts.append(f'''
+            <div class="stat-box">
+                <h4>{category}</h4>
+                <div class="number">{count}</div>
+            </div>
+''')
+    
+    # 生成风险数据JSON
+    risk_data_json = _dumps_json([{
+        '序号': r['序号'],
+        '风险名称': r['风险名称'],
+        '风险等级': r['风险等级'],
+        '地理位置': r.get('地理位置', ['未明确']),
+        '风险描述': r['风险描述']
+    } for r in parsed_data['风险清单']])
+    
+    coordinate_cache_json = _dumps_json(coordinate_cache)
+    
+    # 获取动态提取的地理位置关系
+    location_relationships = parsed_data.get('地理位置关系', {})
+    location_relationships_json = _dumps_json(location_relationships)
+    
+    parts.append(f'''
+        </div>
+    </div>
+    
+    <script>
+        // 风险数据
+        const riskData = {risk_data_json};
+        
+        // 坐标缓存（从coordinate_cache.json加载）
+        const coordinateCache = {coordinate_cache_json};
         
+        // 动态提取的地理位置关系（从报告文本中提取）
+        const dynamicLocationRelationships = {location_relationships_json};
     </script>
-</body>
-</html>
-'''
+''')
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # 去掉模板中用于排版源码的缩进和空行，减小文件体积，并逐段编码为UTF-8（每段只编码一次）；
+    # 静态脚本在导入时已压缩和编码
+    chunks = [_compact_html(part).encode('utf-8') for part in parts]
+    del parts
+    chunks.append(_REPORT_SCRIPT_BYTES)
+    
+    # 各片段直接写入带大缓冲区的临时文件，不拼接整页字符串或字节串；
+    # 写完后再原子替换目标文件，中途中断也不会留下不完整的报告
+    tmp_file = output_file + '.tmp'
+    try:
+        with open(tmp_file, 'wb', buffering=1 << 20) as f:
+            f.writelines(chunks)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
     
     print(f"✓ 已生成HTML报告: {output_file}")
+    
+    if precompress:
+        write_precompressed(output_file, chunks)
 
 
 def extract_datetime_from_folder(folder_name: str) -> Dict[str, str]:
@@ -2453,86 +2914,131 @@ def extract_datetime_from_folder(folder_name: str) -> Dict[str, str]:
     }
 
 
-def batch_generate_reports(reports_dir: str = "reports"):
+def _process_report_folder(reports_dir: str, coordinate_cache: Dict, precompress: bool,
+                           folder_name: str) -> Tuple[Optional[Dict], str]:
+    """
+    解析单个报告文件夹并生成HTML报告（批量模式下在工作进程中运行）
+    处理过程的输出先收集为文本，由主进程按文件夹顺序统一打印，避免多个进程的输出交错
+    
+    参数:
+        reports_dir: 报告目录路径
+        coordinate_cache: 已加载的坐标缓存
+        precompress: 是否同时生成.gz/.br预压缩文件
+        folder_name: 报告文件夹名称
+    
+    返回:
+        (报告信息字典, 日志文本)；处理失败时报告信息为None，日志中包含错误信息
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        report_info = _generate_folder_report(reports_dir, coordinate_cache, precompress, folder_name)
+    return report_info, log.getvalue()
+
+
+def _generate_folder_report(reports_dir: str, coordinate_cache: Dict, precompress: bool,
+                            folder_name: str) -> Optional[Dict]:
+    """
+    解析单个报告文件夹并生成HTML报告，返回报告信息字典；处理失败时返回None
+    """
+    folder_path = os.path.join(reports_dir, folder_name)
+    report_md = os.path.join(folder_path, "research_assessment_manager_report.md")
+    
+    try:
+        print(f"\n正在处理: {folder_name}")
+        print(f"  报告文件: {report_md}")
+        
+        # 解析报告
+        parser = RiskReportParser(report_md)
+        parsed_data = parser.parse_all()
+        
+        # 生成HTML报告
+        output_html = os.path.join(folder_path, "report_visualization.html")
+        generate_html_report(parsed_data, output_html, coordinate_cache, precompress)
+        
+        # 收集报告信息
+        # 计算相对路径（相对于reports目录的父目录）
+        relative_path = os.path.relpath(output_html, os.path.dirname(reports_dir))
+        # 统一使用正斜杠（Web标准）
+        relative_path = relative_path.replace('\\', '/')
+        
+        # 从文件夹名中提取完整的日期和时间信息
+        datetime_info = extract_datetime_from_folder(folder_name)
+        
+        # 如果报告中有日期，优先使用报告的日期，但保留文件夹的时间信息
+        report_date = parsed_data.get('日期')
+        if report_date:
+            # 如果报告日期只有日期部分，尝试合并时间
+            if '_' not in report_date and datetime_info['time']:
+                # 报告日期格式：2026-01-14，文件夹有时间：20:23:57
+                datetime_info['date'] = report_date
+                datetime_info['datetime'] = f"{report_date} {datetime_info['time']}"
+                datetime_info['display'] = datetime_info['datetime']
+        
+        title = parsed_data.get('标题') or '未知标题'
+        author = parsed_data.get('作者') or '未知'
+        
+        report_info = {
+            'folder': folder_name,
+            'title': title,
+            'date': datetime_info['date'],  # 日期部分：2026-01-14
+            'time': datetime_info['time'],  # 时间部分：20:23:57 或空
+            'datetime': datetime_info['datetime'],  # 完整日期时间：2026-01-14 20:23:57
+            'datetime_sort': datetime_info['datetime_sort'],  # 用于排序
+            'display_date': datetime_info['display'],  # 显示用的日期时间
+            'author': author,
+            'risk_count': len(parsed_data.get('风险清单', [])),
+            'html_path': output_html,
+            'relative_path': relative_path
+        }
+        
+        print(f"  ✓ 完成 - 风险数量: {report_info['risk_count']}")
+        return report_info
+        
+    except Exception as e:
+        print(f"  ✗ 错误: {e}")
+        import traceback
+        print(traceback.format_exc(), end='')
+        return None
+
+
+def batch_generate_reports(reports_dir: str = "reports", precompress: bool = False):
     """
-    批量生成所有报告的HTML文件
+    批量生成所有报告的HTML文件（多个报告时使用多进程并行处理）
     
     参数:
         reports_dir: 报告目录路径
+        precompress: 是否同时生成.gz/.br预压缩文件
     """
     if not os.path.exists(reports_dir):
         print(f"错误: 报告目录不存在: {reports_dir}")
         return []
     
+    # 查找包含 research_assessment_manager_report.md 的报告文件夹
+    folder_names = [
+        folder_name for folder_name in os.listdir(reports_dir)
+        if os.path.isfile(os.path.join(reports_dir, folder_name, "research_assessment_manager_report.md"))
+    ]
+    
+    # 坐标缓存在整个批次中只加载一次，所有报告共享
+    coordinate_cache = load_coordinate_cache()
+    process_folder = partial(_process_report_folder, reports_dir, coordinate_cache, precompress)
+    
+    # 各报告互相独立：多个报告时分配到多个进程并行解析和生成；
+    # 结果和日志按文件夹顺序返回，在主进程中依次打印，各报告的输出不会交错
     report_list = []
     
-    # 遍历所有报告文件夹
-    for folder_name in os.listdir(reports_dir):
-        folder_path = os.path.join(reports_dir, folder_name)
-        if not os.path.isdir(folder_path):
-            continue
-        
-        # 查找 research_assessment_manager_report.md
-        report_md = os.path.join(folder_path, "research_assessment_manager_report.md")
-        if not os.path.exists(report_md):
-            continue
-        
-        try:
-            print(f"\n正在处理: {folder_name}")
-            print(f"  报告文件: {report_md}")
-            
-            # 解析报告
-            parser = RiskReportParser(report_md)
-            parsed_data = parser.parse_all()
-            
-            # 生成HTML报告
-            output_html = os.path.join(folder_path, "report_visualization.html")
-            generate_html_report(parsed_data, output_html)
-            
-            # 收集报告信息
-            # 计算相对路径（相对于reports目录的父目录）
-            relative_path = os.path.relpath(output_html, os.path.dirname(reports_dir))
-            # 统一使用正斜杠（Web标准）
-            relative_path = relative_path.replace('\\', '/')
-            
-            # 从文件夹名中提取完整的日期和时间信息
-            datetime_info = extract_datetime_from_folder(folder_name)
-            
-            # 如果报告中有日期，优先使用报告的日期，但保留文件夹的时间信息
-            report_date = parsed_data.get('日期')
-            if report_date:
-                # 如果报告日期只有日期部分，尝试合并时间
-                if '_' not in report_date and datetime_info['time']:
-                    # 报告日期格式：2026-01-14，文件夹有时间：20:23:57
-                    datetime_info['date'] = report_date
-                    datetime_info['datetime'] = f"{report_date} {datetime_info['time']}"
-                    datetime_info['display'] = datetime_info['datetime']
-            
-            title = parsed_data.get('标题') or '未知标题'
-            author = parsed_data.get('作者') or '未知'
-            
-            report_info = {
-                'folder': folder_name,
-                'title': title,
-                'date': datetime_info['date'],  # 日期部分：2026-01-14
-                'time': datetime_info['time'],  # 时间部分：20:23:57 或空
-                'datetime': datetime_info['datetime'],  # 完整日期时间：2026-01-14 20:23:57
-                'datetime_sort': datetime_info['datetime_sort'],  # 用于排序
-                'display_date': datetime_info['display'],  # 显示用的日期时间
-                'author': author,
-                'risk_count': len(parsed_data.get('风险清单', [])),
-                'html_path': output_html,
-                'relative_path': relative_path
-            }
-            report_list.append(report_info)
-            
-            print(f"  ✓ 完成 - 风险数量: {report_info['risk_count']}")
-            
-        except Exception as e:
-            print(f"  ✗ 错误: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+    def collect(results):
+        for report_info, log_text in results:
+            print(log_text, end='')
+            if report_info is not None:
+                report_list.append(report_info)
+    
+    if len(folder_names) > 1:
+        max_workers = min(len(folder_names), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            collect(executor.map(process_folder, folder_names))
+    else:
+        collect(map(process_folder, folder_names))
     
     return report_list
 
@@ -2567,7 +3073,7 @@ def generate_index_html(report_list: List[Dict], output_file: str = "index.html"
             options_html += f'<option value="{relative_path}">{display_text}</option>\n'
     
     # 生成报告数据JSON（用于JavaScript）
-    report_data_json = json.dumps(sorted_reports, ensure_ascii=False, indent=2)
+    report_data_json = _dumps_json(sorted_reports, indent=True)
     
     html = f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -2822,6 +3328,7 @@ def generate_index_html(report_list: List[Dict], output_file: str = "index.html"
         }});
         
         // 查看报告
+        // 需要阻止链接的默认跳转（改为在iframe中打开），因此显式声明为非被动监听器
         viewButton.addEventListener('click', function(e) {{
             e.preventDefault();
             const selectedValue = selector.value;
@@ -2831,7 +3338,7 @@ def generate_index_html(report_list: List[Dict], output_file: str = "index.html"
                 // 滚动到iframe
                 iframeContainer.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
             }}
-        }});
+        }}, {{ passive: false }});
         
         // 初始化统计信息
         updateStats();
@@ -2849,14 +3356,19 @@ def main():
     """主函数"""
     import sys
     
+    # --compress：同时生成预压缩文件（可与其他参数组合使用）
+    args = sys.argv[1:]
+    precompress = '--compress' in args
+    args = [arg for arg in args if arg != '--compress']
+    
     # 检查是否有批量处理参数
-    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+    if args and args[0] == '--batch':
         # 批量处理模式
         print("=" * 80)
         print("批量生成报告HTML文件")
         print("=" * 80)
         
-        report_list = batch_generate_reports()
+        report_list = batch_generate_reports(precompress=precompress)
         
         if report_list:
             print(f"\n{'=' * 80}")
@@ -2871,8 +3383,8 @@ def main():
         return
     
     # 单个文件处理模式
-    if len(sys.argv) > 1:
-        report_path = sys.argv[1]
+    if args:
+        report_path = args[0]
     else:
         report_path = "reports/2026-01-14_20-23-57/research_assessment_manager_report.md"
     
@@ -2888,12 +3400,15 @@ def main():
         
         # 生成HTML报告
         output_html = report_path.replace('.md', '_visualization.html').replace('research_assessment_manager_report', 'report')
-        generate_html_report(parsed_data, output_html)
-        
-        print(f"\n解析完成！")
-        print(f"  - 风险数量: {len(parsed_data['风险清单'])}")
-        print(f"  - 详情数量: {len(parsed_data['风险详情'])}")
-        print(f"  - HTML报告: {output_html}")
+        generate_html_report(parsed_data, output_html, precompress=precompress)
+        
+        # 汇总信息一次性写出
+        sys.stdout.write(
+            f"\n解析完成！\n"
+            f"  - 风险数量: {len(parsed_data['风险清单'])}\n"
+            f"  - 详情数量: {len(parsed_data['风险详情'])}\n"
+            f"  - HTML报告: {output_html}\n"
+        )
         
     except Exception as e:
         print(f"错误: {e}")
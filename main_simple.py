@@ -7,9 +7,73 @@
 
 import os
 import re
+import sys
+import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
 
 
+# 未指定报告文件时默认处理的报告
+DEFAULT_REPORT = "reports/2026-01-14_20-23-57/research_assessment_manager_report.md"
+
+# 预编译的正则表达式（模块级共享，避免每次调用重复编译）
+_TITLE_H2_RE = re.compile(r'##\s*标题[：:]\s*(.+)')
+_TITLE_H3_RE = re.compile(r'^###\s+(.+?)(?:\n|$)', re.MULTILINE)
+_TITLE_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+# 表格行限定在单行之内：从行首的 | 开始，单元格不允许跨行，避免在含 | 的非表格文本上反复回溯
+# （单元格两侧的空白由调用方 strip 去除，正则中不再重复匹配）
+_RISK_ROW_RE = re.compile(
+    r'^[ \t]*\|[ \t]*(\d+)[ \t]*\|([^|\n]+)\|([^|\n]+)\|([^|\n]+)\|([^|\n]+)\|',
+    re.MULTILINE
+)
+_RISK_DETAIL_RE = re.compile(r'#####\s*（(\d+)）\s*([^\n]+)\n(.*?)(?=#####|####|###|$)', re.DOTALL)
+_FIELD_RES = {
+    name: re.compile(rf'- \*\*{name}[：:]\*\*\s*(.+?)(?=\n-|\n#####|$)', re.DOTALL)
+    for name in ('触发条件', '风险表现', '风险等级')
+}
+_JUDGMENT_BASIS_RE = re.compile(r'- \*\*风险等级[：:]\*\*\s*([^\n]+)\s*\n\s*- 判断依据[：:]\s*(.+?)(?=\n-|\n#####|$)', re.DOTALL)
+_COUNTERMEASURES_RE = re.compile(r'- \*\*风险应对[：:]\*\*\s*(.*?)(?=\n-|\n#####|$)', re.DOTALL)
+_NUMBERED_ITEM_RE = re.compile(r'\d+\.\s*([^\n]+)')
+# 标题行之后至少保留一个字符作为正文（与原先 (.+?) 的回溯行为一致）
+_SUMMARY_HEADER_RE = re.compile(r'####\s*\d+\.\s*风险速览\s*\n(?=.)', re.DOTALL)
+# 风险速览正文的结束标记：分隔线或下一个四级（及以下）标题
+_SUMMARY_END_MARKERS = ('\n---', '\n####')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_AUTHOR_OLD_RE = re.compile(r'作者署名[：:]\s*(.+)')
+_AUTHOR_NEW_RE = re.compile(r'####\s*作者署名\s*\n(.+?)(?=\n\d{4}-\d{2}-\d{2}|$)', re.DOTALL)
+_DATE_OLD_RE = re.compile(r'日期[：:]\s*(\d{4}-\d{2}-\d{2})')
+_DATE_NEW_RE = re.compile(r'####\s*作者署名\s*\n.*?\n(\d{4}-\d{2}-\d{2}[_\s]\d{2}-\d{2}-\d{2})', re.DOTALL)
+_DATE_TAIL_RE = re.compile(r'(\d{4}-\d{2}-\d{2})[_\s]\d{2}-\d{2}-\d{2}')
+
+# 常见地理位置关键词（顺序即输出顺序）
+_LOCATION_KEYWORDS = (
+    '荷兰', '中国', '日本', '美国', '欧盟', '欧洲', '德国', '法国', '英国',
+    '澳大利亚', '韩国', '印度', '东南亚', '沿海地区', '国内', '海外',
+    '广汽', '本田', '福岛', '莱茵河', '越南', '中部', '印尼', '印度尼西亚',
+    '鹿儿岛', '塞梅鲁', '东爪哇', '东莞', '安世'
+)
+# 所有关键词合并为一个零宽前瞻分支，一次扫描即可找出每个位置上最长的关键词；
+# 较短的关键词（如"印度"之于"印度尼西亚"）通过 _LOCATION_CONTAINED 补齐
+_LOCATION_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_LOCATION_KEYWORDS, key=len, reverse=True))) + '))'
+)
+_LOCATION_CONTAINED = {
+    keyword: [other for other in _LOCATION_KEYWORDS if other in keyword]
+    for keyword in _LOCATION_KEYWORDS
+}
+# 风险描述中识别出的地理位置少于该数量时，才继续扫描触发条件文本
+_TRIGGER_SCAN_BELOW = 2
+
+
+def _find_location_keywords(text: str) -> List[str]:
+    """返回文本中出现的地理位置关键词，按 _LOCATION_KEYWORDS 的顺序排列"""
+    found = set()
+    for keyword in set(_LOCATION_KEYWORD_RE.findall(text)):
+        found.update(_LOCATION_CONTAINED[keyword])
+    return [keyword for keyword in _LOCATION_KEYWORDS if keyword in found]
+
+
 class RiskReportParser:
     """风险报告解析器"""
     
@@ -21,6 +85,7 @@ class RiskReportParser:
             file_path: 报告文件路径
         """
         self.file_path = file_path
+        self._parsed: Dict = {}
         self.content = self._load_file()
     
     def _load_file(self) -> str:
@@ -31,17 +96,49 @@ class RiskReportParser:
         with open(self.file_path, 'r', encoding='utf-8') as f:
             return f.read()
     
+    def _memoized(self, key: str, parse):
+        """
+        返回 key 对应的解析结果，首次访问时调用 parse 计算并缓存
+        报告内容在初始化后不再变化，各部分只需解析一次
+        """
+        parsed = self._parsed
+        if key not in parsed:
+            parsed[key] = parse()
+        return parsed[key]
+    
+    def _search_from(self, pattern, prefix: str, required: Optional[str] = None):
+        """
+        用 str.find 定位 pattern 的匹配必然以之开头的字面量 prefix，并从该处开始匹配
+        
+        参数:
+            pattern: 预编译的正则表达式
+            prefix: 匹配结果必然以之开头的字面量
+            required: 匹配结果中必然包含的其他字面量（可选）
+        
+        返回:
+            与 pattern.search(self.content) 相同的匹配结果；字面量不存在时直接返回 None
+        """
+        content = self.content
+        if required is not None and required not in content:
+            return None
+        pos = content.find(prefix)
+        if pos < 0:
+            return None
+        return pattern.search(content, pos)
+    
     def extract_title(self) -> Optional[str]:
         """提取报告标题"""
+        return self._memoized('标题', self._parse_title)
+    
+    def _parse_title(self) -> Optional[str]:
+        """解析报告标题"""
         # 匹配：## 标题：xxx
-        pattern = r'##\s*标题[：:]\s*(.+)'
-        match = re.search(pattern, self.content)
+        match = self._search_from(_TITLE_H2_RE, '##', '标题')
         if match:
             return match.group(1).strip()
         
         # 匹配：### xxx（三级标题，如"### 安世供应链外部风险评估报告"）
-        pattern = r'^###\s+(.+?)(?:\n|$)'
-        match = re.search(pattern, self.content, re.MULTILINE)
+        match = self._search_from(_TITLE_H3_RE, '###')
         if match:
             title = match.group(1).strip()
             # 排除"作者署名"等非标题内容
@@ -49,8 +146,7 @@ class RiskReportParser:
                 return title
         
         # 如果没有找到，尝试从一级标题提取
-        pattern = r'^#\s+(.+)$'
-        match = re.search(pattern, self.content, re.MULTILINE)
+        match = self._search_from(_TITLE_H1_RE, '#')
         if match:
             return match.group(1).strip()
         
@@ -66,30 +162,14 @@ class RiskReportParser:
         返回:
             List[str]: 地理位置列表
         """
-        locations = []
-        
-        # 常见地理位置关键词
-        location_keywords = [
-            '荷兰', '中国', '日本', '美国', '欧盟', '欧洲', '德国', '法国', '英国',
-            '澳大利亚', '韩国', '印度', '东南亚', '沿海地区', '国内', '海外',
-            '广汽', '本田', '福岛', '莱茵河', '越南', '中部', '印尼', '印度尼西亚',
-            '鹿儿岛', '塞梅鲁', '东爪哇', '东莞', '安世'
-        ]
-        
         # 从文本中查找地理位置
-        for keyword in location_keywords:
-            if keyword in text:
-                if keyword not in locations:
-                    locations.append(keyword)
+        locations = _find_location_keywords(text)
         
         # 如果没有找到明确位置，尝试从风险速览中提取
         if not locations:
             summary = self.extract_risk_summary()
             if summary:
-                for keyword in location_keywords:
-                    if keyword in summary:
-                        if keyword not in locations:
-                            locations.append(keyword)
+                locations = _find_location_keywords(summary)
         
         return locations if locations else ['未明确']
     
@@ -97,34 +177,47 @@ class RiskReportParser:
         """
         提取风险清单表格
         
+        返回:
+            List[Dict]: 风险列表，每个风险包含序号、名称、类别、等级、描述、地理位置
+        """
+        return self._memoized('风险清单', self._parse_risk_list)
+    
+    def _parse_risk_list(self) -> List[Dict]:
+        """
+        解析风险清单表格
+        
         返回:
             List[Dict]: 风险列表，每个风险包含序号、名称、类别、等级、描述、地理位置
         """
         risks = []
         
-        # 匹配表格行：| 序号 | 风险名称 | 风险类别 | 风险等级 | 风险描述 |
-        # 跳过表头行
-        pattern = r'\|\s*(\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        matches = re.findall(pattern, self.content)
+        # 风险详情只解析一次，按序号建立索引（同一序号以首次出现的为准）
+        details_by_seq = {}
+        for detail in self.extract_risk_details():
+            details_by_seq.setdefault(detail['序号'], detail)
         
-        for match in matches:
-            seq, name, category, level, description = match
+        # 匹配表格行：| 序号 | 风险名称 | 风险类别 | 风险等级 | 风险描述 |
+        # 跳过表头行；逐个消费匹配结果，不预先生成完整的元组列表
+        for match in _RISK_ROW_RE.finditer(self.content):
+            seq, name, category, level, description = match.groups()
+            seq_int = int(seq.strip())
             # 提取地理位置
             locations = self.extract_location_from_text(description)
-            # 也从风险详情中提取
-            risk_details = self.extract_risk_details()
-            for detail in risk_details:
-                if detail['序号'] == int(seq.strip()):
-                    trigger_text = detail.get('触发条件', '') or ''
-                    if trigger_text:
-                        detail_locations = self.extract_location_from_text(trigger_text)
-                        for loc in detail_locations:
-                            if loc not in locations and loc != '未明确':
-                                locations.append(loc)
-                    break
+            # 描述中识别出的地理位置不足时，再从风险详情的触发条件中补充
+            detail = details_by_seq.get(seq_int) if len(locations) < _TRIGGER_SCAN_BELOW else None
+            if detail is not None:
+                trigger_text = detail.get('触发条件', '') or ''
+                if trigger_text:
+                    detail_locations = self.extract_location_from_text(trigger_text)
+                    seen = set(locations)
+                    seen.add('未明确')
+                    for loc in detail_locations:
+                        if loc not in seen:
+                            locations.append(loc)
+                            seen.add(loc)
             
             risks.append({
-                '序号': int(seq.strip()),
+                '序号': seq_int,
                 '风险名称': name.strip(),
                 '风险类别': category.strip(),
                 '风险等级': level.strip(),
@@ -138,6 +231,15 @@ class RiskReportParser:
         """
         提取风险详情
         
+        返回:
+            List[Dict]: 风险详情列表，每个风险包含触发条件、风险表现、风险等级、判断依据、风险应对
+        """
+        return self._memoized('风险详情', self._parse_risk_details)
+    
+    def _parse_risk_details(self) -> List[Dict]:
+        """
+        解析风险详情
+        
         返回:
             List[Dict]: 风险详情列表，每个风险包含触发条件、风险表现、风险等级、判断依据、风险应对
         """
@@ -145,10 +247,8 @@ class RiskReportParser:
         
         # 匹配风险详情块：##### （序号）风险名称
         # 然后提取后续内容直到下一个风险或章节结束
-        pattern = r'#####\s*（(\d+)）\s*([^\n]+)\n(.*?)(?=#####|####|###|$)'
-        matches = re.findall(pattern, self.content, re.DOTALL)
-        
-        for seq, name, content in matches:
+        for match in _RISK_DETAIL_RE.finditer(self.content):
+            seq, name, content = match.groups()
             detail = {
                 '序号': int(seq),
                 '风险名称': name.strip(),
@@ -164,8 +264,7 @@ class RiskReportParser:
     
     def _extract_field(self, content: str, field_name: str) -> Optional[str]:
         """提取字段内容"""
-        pattern = rf'- \*\*{field_name}[：:]\*\*\s*(.+?)(?=\n-|\n#####|$)'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _FIELD_RES[field_name].search(content)
         if match:
             return match.group(1).strip()
         return None
@@ -173,37 +272,41 @@ class RiskReportParser:
     def _extract_judgment_basis(self, content: str) -> Optional[str]:
         """提取判断依据"""
         # 判断依据可能在风险等级字段下
-        pattern = r'- \*\*风险等级[：:]\*\*\s*([^\n]+)\s*\n\s*- 判断依据[：:]\s*(.+?)(?=\n-|\n#####|$)'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _JUDGMENT_BASIS_RE.search(content)
         if match:
             return match.group(2).strip()
         return None
     
     def _extract_countermeasures(self, content: str) -> List[str]:
         """提取风险应对措施"""
-        countermeasures = []
-        
         # 匹配风险应对部分
-        pattern = r'- \*\*风险应对[：:]\*\*\s*(.*?)(?=\n-|\n#####|$)'
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            measures_text = match.group(1)
-            # 提取编号列表项
-            pattern_items = r'\d+\.\s*([^\n]+)'
-            items = re.findall(pattern_items, measures_text)
-            countermeasures = [item.strip() for item in items]
+        match = _COUNTERMEASURES_RE.search(content)
+        if match is None:
+            return []
         
-        return countermeasures
+        # 提取编号列表项（findall 与 strip 均在 C 层完成，不经过 Python 层循环）
+        return list(map(str.strip, _NUMBERED_ITEM_RE.findall(match.group(1))))
     
     def extract_risk_summary(self) -> Optional[str]:
         """提取风险速览"""
-        # 匹配：#### 数字. 风险速览 后面的内容（支持不同的编号）
-        pattern = r'####\s*\d+\.\s*风险速览\s*\n(.+?)(?=\n---|\n####|$)'
-        match = re.search(pattern, self.content, re.DOTALL)
+        return self._memoized('风险速览', self._parse_risk_summary)
+    
+    def _parse_risk_summary(self) -> Optional[str]:
+        """解析风险速览"""
+        # 匹配：#### 数字. 风险速览 标题行（支持不同的编号）
+        content = self.content
+        match = self._search_from(_SUMMARY_HEADER_RE, '####', '风险速览')
         if match:
-            summary = match.group(1).strip()
+            # 正文只截取到下一个分隔线/标题为止，后续处理都在这一小段上进行
+            start = match.end()
+            end = len(content)
+            for marker in _SUMMARY_END_MARKERS:
+                pos = content.find(marker, start + 1, end)
+                if pos >= 0:
+                    end = pos
+            summary = content[start:end].strip()
             # 清理内容，移除多余的换行和空白
-            summary = re.sub(r'\n{3,}', '\n\n', summary)
+            summary = _BLANK_LINES_RE.sub('\n\n', summary)
             # 如果是列表格式，转换为更易读的格式
             summary = summary.replace('- **', '\n- **').replace('**：', '**：')
             return summary.strip()
@@ -211,15 +314,17 @@ class RiskReportParser:
     
     def extract_author(self) -> Optional[str]:
         """提取作者署名"""
+        return self._memoized('作者', self._parse_author)
+    
+    def _parse_author(self) -> Optional[str]:
+        """解析作者署名"""
         # 匹配：作者署名[：:]\s*(.+)（旧格式）
-        pattern = r'作者署名[：:]\s*(.+)'
-        match = re.search(pattern, self.content)
+        match = self._search_from(_AUTHOR_OLD_RE, '作者署名')
         if match:
             return match.group(1).strip()
         
         # 匹配：#### 作者署名 后面的内容（新格式）
-        pattern = r'####\s*作者署名\s*\n(.+?)(?=\n\d{4}-\d{2}-\d{2}|$)'
-        match = re.search(pattern, self.content, re.DOTALL)
+        match = self._search_from(_AUTHOR_NEW_RE, '####', '作者署名')
         if match:
             author = match.group(1).strip()
             # 提取第一行作为作者
@@ -230,15 +335,17 @@ class RiskReportParser:
     
     def extract_date(self) -> Optional[str]:
         """提取日期"""
+        return self._memoized('日期', self._parse_date)
+    
+    def _parse_date(self) -> Optional[str]:
+        """解析日期"""
         # 匹配：日期[：:]\s*(\d{4}-\d{2}-\d{2})（旧格式）
-        pattern = r'日期[：:]\s*(\d{4}-\d{2}-\d{2})'
-        match = re.search(pattern, self.content)
+        match = self._search_from(_DATE_OLD_RE, '日期')
         if match:
             return match.group(1).strip()
         
         # 匹配：#### 作者署名 后面的日期行（新格式：2026-01-16_16-08-49）
-        pattern = r'####\s*作者署名\s*\n.*?\n(\d{4}-\d{2}-\d{2}[_\s]\d{2}-\d{2}-\d{2})'
-        match = re.search(pattern, self.content, re.DOTALL)
+        match = self._search_from(_DATE_NEW_RE, '####', '作者署名')
         if match:
             date_str = match.group(1).strip()
             # 将格式转换为标准格式：2026-01-16_16-08-49 -> 2026-01-16
@@ -246,8 +353,7 @@ class RiskReportParser:
             return date_str
         
         # 匹配文件末尾的日期格式：2026-01-16_16-08-49
-        pattern = r'(\d{4}-\d{2}-\d{2})[_\s]\d{2}-\d{2}-\d{2}'
-        match = re.search(pattern, self.content)
+        match = _DATE_TAIL_RE.search(self.content)
         if match:
             return match.group(1).strip()
         
@@ -270,278 +376,299 @@ class RiskReportParser:
         }
 
 
+def _parse_report(report_path: str) -> Dict:
+    """解析单个报告（供进程池调用，需为模块级函数）"""
+    return RiskReportParser(report_path).parse_all()
+
+
+def parse_reports(report_paths: List[str]) -> List[Dict]:
+    """
+    批量解析多个报告（多个报告时使用多进程并行处理）
+    
+    参数:
+        report_paths: 报告文件路径列表
+    
+    返回:
+        List[Dict]: 与 report_paths 顺序一致的解析结果列表
+    """
+    if len(report_paths) > 1:
+        max_workers = min(len(report_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_report, report_paths))
+    return [_parse_report(report_path) for report_path in report_paths]
+
+
 def print_report_summary(parsed_data: Dict):
-    """打印报告摘要"""
-    print("=" * 80)
-    print(f"报告标题: {parsed_data['标题']}")
-    print(f"作者: {parsed_data['作者']}")
-    print(f"日期: {parsed_data['日期']}")
-    print("=" * 80)
-    print()
+    """打印报告摘要（各行先收集起来，最后一次性写出）"""
+    lines = [
+        "=" * 80,
+        f"报告标题: {parsed_data['标题']}",
+        f"作者: {parsed_data['作者']}",
+        f"日期: {parsed_data['日期']}",
+        "=" * 80,
+        "",
+    ]
+    append = lines.append
     
-    # 打印风险清单
-    print("【风险清单】")
-    print("-" * 80)
+    # 风险清单
+    append("【风险清单】")
+    append("-" * 80)
     risks = parsed_data['风险清单']
-    print(f"共发现 {len(risks)} 个风险：")
-    print()
+    append(f"共发现 {len(risks)} 个风险：")
+    append("")
     
     for risk in risks:
-        print(f"  [{risk['序号']}] {risk['风险名称']}")
-        print(f"      类别: {risk['风险类别']}")
-        print(f"      等级: {risk['风险等级']}")
-        print(f"      描述: {risk['风险描述']}")
-        print()
+        append(f"  [{risk['序号']}] {risk['风险名称']}")
+        append(f"      类别: {risk['风险类别']}")
+        append(f"      等级: {risk['风险等级']}")
+        append(f"      描述: {risk['风险描述']}")
+        append("")
     
-    # 打印风险速览
+    # 风险速览
     if parsed_data['风险速览']:
-        print("【风险速览】")
-        print("-" * 80)
-        print(parsed_data['风险速览'])
-        print()
+        append("【风险速览】")
+        append("-" * 80)
+        append(parsed_data['风险速览'])
+        append("")
     
-    # 打印风险统计
-    print("【风险统计】")
-    print("-" * 80)
-    risk_levels = {}
-    risk_categories = {}
+    # 风险统计
+    append("【风险统计】")
+    append("-" * 80)
+    risk_levels = Counter(risk['风险等级'] for risk in risks)
+    risk_categories = Counter(risk['风险类别'] for risk in risks)
     
-    for risk in risks:
-        level = risk['风险等级']
-        category = risk['风险类别']
-        
-        risk_levels[level] = risk_levels.get(level, 0) + 1
-        risk_categories[category] = risk_categories.get(category, 0) + 1
+    append("按风险等级统计：")
+    for level, count in risk_levels.most_common():
+        append(f"  {level}: {count} 个")
     
-    print("按风险等级统计：")
-    for level, count in sorted(risk_levels.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {level}: {count} 个")
+    append("")
+    append("按风险类别统计：")
+    for category, count in risk_categories.most_common():
+        append(f"  {category}: {count} 个")
+    append("")
     
-    print()
-    print("按风险类别统计：")
-    for category, count in sorted(risk_categories.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {category}: {count} 个")
-    print()
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# 地理位置坐标映射（用于地图标记，HTML 中的 locationCoords 也由此生成）
+_LOC_COORDS = {
+    '荷兰': (52.1326, 5.2913),
+    '中国': (35.8617, 104.1954),
+    '日本': (36.2048, 138.2529),
+    '美国': (37.0902, -95.7129),
+    '欧盟': (50.1109, 8.6821),
+    '欧洲': (50.1109, 8.6821),
+    '德国': (51.1657, 10.4515),
+    '法国': (46.2276, 2.2137),
+    '英国': (55.3781, -3.4360),
+    '澳大利亚': (-25.2744, 133.7751),
+    '韩国': (35.9078, 127.7669),
+    '印度': (20.5937, 78.9629),
+    '东南亚': (1.3521, 103.8198),
+    '沿海地区': (30.0, 120.0),
+    '国内': (35.8617, 104.1954),
+    '广汽': (23.1291, 113.2644),
+    '福岛': (37.75, 140.47),
+    '越南': (14.0583, 108.2772),
+    '中部': (30.0, 108.0),
+}
+# 嵌入页面的 JSON 使用紧凑分隔符，减小页面体积
+_JSON_SEPARATORS = (',', ':')
+_LOC_COORDS_JSON = json.dumps(
+    {name: list(coords) for name, coords in _LOC_COORDS.items()},
+    ensure_ascii=False, separators=_JSON_SEPARATORS
+)
+# 地图脚本用到的风险字段
+_RISK_DATA_KEYS = ('序号', '风险名称', '风险等级', '地理位置', '风险描述')
 
 
 def get_location_coords(location: str) -> tuple:
     """获取地理位置的坐标（用于地图标记）"""
-    location_coords = {
-        '荷兰': (52.1326, 5.2913),
-        '中国': (35.8617, 104.1954),
-        '日本': (36.2048, 138.2529),
-        '美国': (37.0902, -95.7129),
-        '欧盟': (50.1109, 8.6821),
-        '欧洲': (50.1109, 8.6821),
-        '德国': (51.1657, 10.4515),
-        '法国': (46.2276, 2.2137),
-        '英国': (55.3781, -3.4360),
-        '澳大利亚': (-25.2744, 133.7751),
-        '韩国': (35.9078, 127.7669),
-        '印度': (20.5937, 78.9629),
-        '东南亚': (1.3521, 103.8198),
-        '沿海地区': (30.0, 120.0),
-        '国内': (35.8617, 104.1954),
-        '广汽': (23.1291, 113.2644),
-        '福岛': (37.75, 140.47),
-        '越南': (14.0583, 108.2772),
-        '中部': (30.0, 108.0),
-    }
-    return location_coords.get(location, (30.0, 120.0))  # 默认坐标
+    return _LOC_COORDS.get(location, (30.0, 120.0))  # 默认坐标
 
-def generate_html_report(parsed_data: Dict, output_file: str):
-    """生成HTML格式的报告"""
-    html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{parsed_data['标题'] or '风险报告'}</title>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
-    <style>
-        * {{
+
+# 报告页面样式（纯静态文本，无需在每次生成时经 f-string 处理）
+_CSS = '''        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Microsoft YaHei', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background: #f5f5f5;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        h1 {{
+        h1 {
             color: #2c3e50;
             border-bottom: 3px solid #3498db;
             padding-bottom: 10px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .meta {{
+        .meta {
             color: #7f8c8d;
             margin-bottom: 30px;
             font-size: 14px;
-        }}
+        }
         
-        .meta span {{
+        .meta span {
             margin-right: 20px;
-        }}
+        }
         
-        h2 {{
+        h2 {
             color: #34495e;
             margin-top: 40px;
             margin-bottom: 20px;
             padding-left: 10px;
             border-left: 4px solid #3498db;
-        }}
+        }
         
-        h3 {{
+        h3 {
             color: #555;
             margin-top: 30px;
             margin-bottom: 15px;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             font-size: 14px;
-        }}
+        }
         
-        th, td {{
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
+        }
         
-        th {{
+        th {
             background: #3498db;
             color: white;
             font-weight: 600;
-        }}
+        }
         
-        tr:hover {{
+        tr:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .risk-level-high {{
+        .risk-level-high {
             color: #e74c3c;
             font-weight: bold;
-        }}
+        }
         
-        .risk-level-medium {{
+        .risk-level-medium {
             color: #f39c12;
             font-weight: bold;
-        }}
+        }
         
-        .risk-level-low {{
+        .risk-level-low {
             color: #27ae60;
             font-weight: bold;
-        }}
+        }
         
-        .risk-detail {{
+        .risk-detail {
             margin: 30px 0;
             padding: 20px;
             background: #f8f9fa;
             border-radius: 6px;
             border-left: 4px solid #3498db;
-        }}
+        }
         
-        .risk-detail h4 {{
+        .risk-detail h4 {
             color: #2c3e50;
             margin-bottom: 15px;
-        }}
+        }
         
-        .risk-detail p {{
+        .risk-detail p {
             margin: 10px 0;
-        }}
+        }
         
-        .risk-detail strong {{
+        .risk-detail strong {
             color: #34495e;
-        }}
+        }
         
-        .countermeasures {{
+        .countermeasures {
             margin-top: 15px;
-        }}
+        }
         
-        .countermeasures ol {{
+        .countermeasures ol {
             margin-left: 20px;
-        }}
+        }
         
-        .countermeasures li {{
+        .countermeasures li {
             margin: 8px 0;
-        }}
+        }
         
-        .summary {{
+        .summary {
             background: #fff3cd;
             padding: 20px;
             border-radius: 6px;
             border-left: 4px solid #ffc107;
             margin: 30px 0;
-        }}
+        }
         
-        .summary .markdown-content {{
+        .summary .markdown-content {
             line-height: 1.8;
-        }}
+        }
         
-        .summary .markdown-content ul {{
+        .summary .markdown-content ul {
             margin: 10px 0;
             padding-left: 25px;
-        }}
+        }
         
-        .summary .markdown-content li {{
+        .summary .markdown-content li {
             margin: 8px 0;
-        }}
+        }
         
-        .summary .markdown-content strong {{
+        .summary .markdown-content strong {
             color: #856404;
             font-weight: 600;
-        }}
+        }
         
-        .summary .markdown-content p {{
+        .summary .markdown-content p {
             margin: 10px 0;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: flex;
             gap: 30px;
             margin: 30px 0;
-        }}
+        }
         
-        .stat-box {{
+        .stat-box {
             flex: 1;
             padding: 20px;
             background: #ecf0f1;
             border-radius: 6px;
             text-align: center;
-        }}
+        }
         
-        .stat-box h4 {{
+        .stat-box h4 {
             color: #7f8c8d;
             margin-bottom: 10px;
-        }}
+        }
         
-        .stat-box .number {{
+        .stat-box .number {
             font-size: 32px;
             font-weight: bold;
             color: #3498db;
-        }}
+        }
         
-        .location-tag {{
+        .location-tag {
             display: inline-block;
             padding: 4px 8px;
             margin: 2px;
@@ -550,103 +677,103 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             border-radius: 4px;
             font-size: 12px;
             font-weight: 500;
-        }}
+        }
         
-        .map-container {{
+        .map-container {
             width: 100%;
             height: 500px;
             margin: 20px 0;
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .risk-cards {{
+        .risk-cards {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
             gap: 20px;
             margin: 30px 0;
-        }}
+        }
         
-        .risk-card {{
+        .risk-card {
             background: white;
             border: 2px solid #e0e0e0;
             border-radius: 8px;
             padding: 20px;
             transition: all 0.3s ease;
             cursor: pointer;
-        }}
+        }
         
-        .risk-card:hover {{
+        .risk-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 4px 12px rgba(0,0,0,0.15);
             border-color: #3498db;
-        }}
+        }
         
-        .risk-card.high {{
+        .risk-card.high {
             border-left: 4px solid #e74c3c;
-        }}
+        }
         
-        .risk-card.medium {{
+        .risk-card.medium {
             border-left: 4px solid #f39c12;
-        }}
+        }
         
-        .risk-card.low {{
+        .risk-card.low {
             border-left: 4px solid #27ae60;
-        }}
+        }
         
-        .risk-card h4 {{
+        .risk-card h4 {
             margin: 0 0 10px 0;
             color: #2c3e50;
-        }}
+        }
         
-        .risk-card .level {{
+        .risk-card .level {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 12px;
             font-weight: bold;
             margin-bottom: 10px;
-        }}
+        }
         
-        .risk-card .level.high {{
+        .risk-card .level.high {
             background: #e74c3c;
             color: white;
-        }}
+        }
         
-        .risk-card .level.medium {{
+        .risk-card .level.medium {
             background: #f39c12;
             color: white;
-        }}
+        }
         
-        .risk-card .level.low {{
+        .risk-card .level.low {
             background: #27ae60;
             color: white;
-        }}
+        }
         
-        .view-toggle {{
+        .view-toggle {
             display: flex;
             gap: 10px;
             margin: 0;
             margin-left: auto;
-        }}
+        }
         
-        .section-header {{
+        .section-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-top: 40px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .section-header h2 {{
+        .section-header h2 {
             margin: 0 !important;
             padding-left: 10px;
             border-left: 4px solid #3498db;
             color: #34495e;
-        }}
+        }
         
-        .view-toggle button {{
+        .view-toggle button {
             padding: 10px 20px;
             border: 2px solid #3498db;
             background: white;
@@ -655,64 +782,82 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             cursor: pointer;
             font-size: 14px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .view-toggle button.active {{
+        .view-toggle button.active {
             background: #3498db;
             color: white;
-        }}
+        }
         
-        .view-toggle button:hover {{
+        .view-toggle button:hover {
             background: #2980b9;
             color: white;
             border-color: #2980b9;
-        }}
+        }
         
-        .view-section {{
+        .view-section {
             display: none;
-        }}
+        }
         
-        .view-section.active {{
+        .view-section.active {
             display: block;
-        }}
-    </style>
+        }
+'''
+
+
+# 有对应样式的风险等级
+_KNOWN_LEVELS = frozenset(('高', '中', '低'))
+# 地图标记的风险等级颜色（未知等级使用默认颜色）
+_LEVEL_COLORS = {'高': '#e74c3c', '中': '#f39c12', '低': '#27ae60'}
+_DEFAULT_LEVEL_COLOR = '#95a5a6'
+
+# 页面各部分的静态模板，动态内容通过 % 格式化填入
+# 页面头部（%s: 标题）
+_HTML_HEAD = '''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>%s</title>
+    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
+    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
+    <style>
+'''
+# 正文开头（%s: 标题、作者、日期）
+_HTML_BODY_START = '''    </style>
 </head>
 <body>
     <div class="container">
-        <h1>{parsed_data['标题'] or '风险报告'}</h1>
+        <h1>%s</h1>
         
         <div class="meta">
-            <span>作者: {parsed_data['作者'] or '未知'}</span>
-            <span>日期: {parsed_data['日期'] or '未知'}</span>
+            <span>作者: %s</span>
+            <span>日期: %s</span>
         </div>
         
         <h2>1. 风险速览</h2>
 '''
-    
-    # 添加风险速览（使用markdown渲染）
-    if parsed_data['风险速览']:
-        # 将markdown内容转换为JSON字符串以便安全嵌入HTML
-        import json
-        summary_markdown = json.dumps(parsed_data['风险速览'], ensure_ascii=False)
-        html += f'''
+# 风险速览（%s: JSON 编码后的 markdown 文本，由 marked 在浏览器端渲染）
+_SUMMARY_TEMPLATE = '''
         <div class="summary">
             <div class="markdown-content" id="risk-summary-content"></div>
             <script>
-                (function() {{
-                    const summaryMarkdown = {summary_markdown};
+                (function() {
+                    const summaryMarkdown = %s;
                     const summaryContent = document.getElementById('risk-summary-content');
-                    if (summaryContent && typeof marked !== 'undefined') {{
+                    if (summaryContent && typeof marked !== 'undefined') {
                         summaryContent.innerHTML = marked.parse(summaryMarkdown);
-                    }} else if (summaryContent) {{
+                    } else if (summaryContent) {
                         // 如果marked库未加载，显示原始文本
                         summaryContent.textContent = summaryMarkdown;
-                    }}
-                }})();
+                    }
+                })();
             </script>
         </div>
 '''
-    
-    html += '''
+# 视图切换按钮与表格视图表头
+_TABLE_VIEW_START = '''
         <div class="section-header">
             <h2>2. 风险清单</h2>
             <div class="view-toggle">
@@ -736,24 +881,19 @@ def generate_html_report(parsed_data: Dict, output_file: str):
                 </thead>
                 <tbody>
 '''
-    
-    # 添加风险清单表格行
-    for risk in parsed_data['风险清单']:
-        level_class = f"risk-level-{risk['风险等级'].lower()}" if risk['风险等级'] in ['高', '中', '低'] else ""
-        locations = risk.get('地理位置', ['未明确'])
-        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
-        html += f'''
+# 表格行（%s: 序号、名称、类别、等级样式、等级、地理位置标签、描述）
+_TABLE_ROW_TEMPLATE = '''
                 <tr>
-                    <td>{risk['序号']}</td>
-                    <td>{risk['风险名称']}</td>
-                    <td>{risk['风险类别']}</td>
-                    <td class="{level_class}">{risk['风险等级']}</td>
-                    <td>{location_html}</td>
-                    <td>{risk['风险描述']}</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td class="%s">%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
                 </tr>
 '''
-    
-    html += '''
+# 表格视图结束，卡片视图开始
+_CARDS_VIEW_START = '''
             </tbody>
         </table>
         </div>
@@ -761,32 +901,26 @@ def generate_html_report(parsed_data: Dict, output_file: str):
         <div id="cards-view" class="view-section">
             <div class="risk-cards">
 '''
-    
-    # 添加风险卡片
-    for risk in parsed_data['风险清单']:
-        level = risk['风险等级'].lower()
-        level_class = level if level in ['高', '中', '低'] else 'medium'
-        locations = risk.get('地理位置', ['未明确'])
-        location_html = ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations])
-        html += f'''
-                <div class="risk-card {level_class}" onclick="scrollToDetail({risk['序号']})">
-                    <h4>{risk['风险名称']}</h4>
+# 风险卡片（%s: 等级样式、序号、名称、等级样式、等级、类别、地理位置标签、截断后的描述）
+_CARD_TEMPLATE = '''
+                <div class="risk-card %s" onclick="scrollToDetail(%s)">
+                    <h4>%s</h4>
                     <div>
-                        <span class="level {level_class}">{risk['风险等级']}风险</span>
+                        <span class="level %s">%s风险</span>
                     </div>
                     <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
-                        <strong>类别：</strong>{risk['风险类别']}
+                        <strong>类别：</strong>%s
                     </p>
                     <p style="color: #7f8c8d; font-size: 13px; margin: 10px 0;">
-                        <strong>地理位置：</strong>{location_html}
+                        <strong>地理位置：</strong>%s
                     </p>
                     <p style="color: #555; font-size: 14px; margin-top: 10px;">
-                        {risk['风险描述'][:80]}{'...' if len(risk['风险描述']) > 80 else ''}
+                        %s
                     </p>
                 </div>
 '''
-    
-    html += '''
+# 卡片视图结束与地图视图容器
+_MAP_VIEW = '''
             </div>
         </div>
         
@@ -794,271 +928,346 @@ def generate_html_report(parsed_data: Dict, output_file: str):
             <div id="risk-map" class="map-container"></div>
         </div>
     '''
-    # 添加统计信息
-    risks = parsed_data['风险清单']
-    risk_levels = {}
-    risk_categories = {}
-    
-    for risk in risks:
-        level = risk['风险等级']
-        category = risk['风险类别']
-        risk_levels[level] = risk_levels.get(level, 0) + 1
-        risk_categories[category] = risk_categories.get(category, 0) + 1
-    
-    html += '''
+# 风险统计开头（%s: 总风险数）
+_STATS_START = '''
         <h2>3. 风险统计</h2>
         <div class="stats">
             <div class="stat-box">
                 <h4>总风险数</h4>
-                <div class="number">''' + str(len(risks)) + '''</div>
+                <div class="number">%s</div>
             </div>
 '''
-    
-    for level, count in sorted(risk_levels.items(), key=lambda x: x[1], reverse=True):
-        html += f'''
+# 统计项（%s: 名称、数量）
+_STAT_BOX_TEMPLATE = '''
             <div class="stat-box">
-                <h4>{level}风险</h4>
-                <div class="number">{count}</div>
+                <h4>%s</h4>
+                <div class="number">%s</div>
             </div>
 '''
-    
-    html += '''
+# 等级统计与类别统计之间的分隔
+_STATS_SEPARATOR = '''
         </div>
         
         <div class="stats">
 '''
-    
-    for category, count in sorted(risk_categories.items(), key=lambda x: x[1], reverse=True):
-        html += f'''
-            <div class="stat-box">
-                <h4>{category}</h4>
-                <div class="number">{count}</div>
-            </div>
-'''
-    
-    # 生成风险数据JSON
-    import json
-    risk_data_json = json.dumps([{
-        '序号': r['序号'],
-        '风险名称': r['风险名称'],
-        '风险等级': r['风险等级'],
-        '地理位置': r.get('地理位置', ['未明确']),
-        '风险描述': r['风险描述']
-    } for r in parsed_data['风险清单']], ensure_ascii=False)
-    
-    html += f'''
+# 统计区结束及风险数据脚本，riskData 的JSON写在开始与结束两段之间
+_RISK_DATA_SCRIPT_START = '''
         </div>
     </div>
     
     <script>
         // 风险数据
-        const riskData = {risk_data_json};
-        
+        const riskData = '''
+_RISK_DATA_SCRIPT_END = ''';
+    </script>
+'''
+
+
+# 页面末尾的交互脚本（与报告内容无关，riskData 由前面单独的 <script> 定义）
+_HTML_TAIL = '''    <script>
         // 视图切换
-        function showView(viewType, buttonElement) {{
+        function showView(viewType, buttonElement) {
             // 隐藏所有视图
             const viewSections = document.querySelectorAll('.view-section');
-            if (viewSections.length === 0) {{
+            if (viewSections.length === 0) {
                 console.warn('未找到.view-section元素');
                 return;
-            }}
-            viewSections.forEach(section => {{
+            }
+            viewSections.forEach(section => {
                 section.classList.remove('active');
-            }});
+            });
             
             // 更新所有按钮状态
             const toggleBtns = document.querySelectorAll('.view-toggle button');
-            toggleBtns.forEach(btn => {{
+            toggleBtns.forEach(btn => {
                 btn.classList.remove('active');
-            }});
+            });
             
             // 显示选中的视图
             const targetView = document.getElementById(viewType + '-view');
-            if (targetView) {{
+            if (targetView) {
                 targetView.classList.add('active');
-            }} else {{
+            } else {
                 console.warn('未找到视图元素: ' + viewType + '-view');
                 return;
-            }}
+            }
             
             // 激活被点击的按钮
-            if (buttonElement) {{
+            if (buttonElement) {
                 buttonElement.classList.add('active');
-            }} else {{
+            } else {
                 // 如果没有传递buttonElement，通过viewType找到对应的按钮
-                toggleBtns.forEach(btn => {{
+                toggleBtns.forEach(btn => {
                     const btnText = btn.textContent.trim();
                     if ((viewType === 'table' && btnText.includes('表格')) ||
                         (viewType === 'cards' && btnText.includes('卡片')) ||
-                        (viewType === 'map' && btnText.includes('地图'))) {{
+                        (viewType === 'map' && btnText.includes('地图'))) {
                         btn.classList.add('active');
-                    }}
-                }});
-            }}
+                    }
+                });
+            }
             
             // 如果是地图视图，延迟初始化地图（确保DOM已更新）
-            if (viewType === 'map') {{
-                setTimeout(function() {{
+            if (viewType === 'map') {
+                setTimeout(function() {
                     initMap();
-                }}, 100);
-            }}
-        }}
+                }, 100);
+            }
+        }
         
         // 初始化地图（修复检查逻辑+增加错误处理）
-        function initMap() {{
+        function initMap() {
             const mapContainer = document.getElementById('risk-map');
             // 更严谨的地图初始化检查：判断是否已有Leaflet地图实例
-            if (!mapContainer || mapContainer._leaflet_id) {{
+            if (!mapContainer || mapContainer._leaflet_id) {
                 return; // 容器不存在 或 地图已初始化
-            }}
+            }
             
             // 检查Leaflet库是否加载
-            if (typeof L === 'undefined') {{
+            if (typeof L === 'undefined') {
                 console.error('Leaflet地图库未加载！');
                 mapContainer.innerHTML = '<div style="padding: 20px; color: red;">地图库加载失败，请刷新页面</div>';
                 return;
-            }}
+            }
             
             // 创建地图
             const map = L.map('risk-map').setView([30, 120], 3);
             
             // 添加地图图层
-            L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{ 
+            L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', { 
                 attribution: '© OpenStreetMap contributors',
                 maxZoom: 18
-            }}).addTo(map);
-            
-            // 风险等级颜色映射
-            const levelColors = {{
-                '高': '#e74c3c',
-                '中': '#f39c12',
-                '低': '#27ae60'
-            }};
+            }).addTo(map);
             
             // 地理位置坐标映射
-            const locationCoords = {{
-                '荷兰': [52.1326, 5.2913],
-                '中国': [35.8617, 104.1954],
-                '日本': [36.2048, 138.2529],
-                '美国': [37.0902, -95.7129],
-                '欧盟': [50.1109, 8.6821],
-                '欧洲': [50.1109, 8.6821],
-                '德国': [51.1657, 10.4515],
-                '法国': [46.2276, 2.2137],
-                '英国': [55.3781, -3.4360],
-                '澳大利亚': [-25.2744, 133.7751],
-                '韩国': [35.9078, 127.7669],
-                '印度': [20.5937, 78.9629],
-                '东南亚': [1.3521, 103.8198],
-                '沿海地区': [30.0, 120.0],
-                '国内': [35.8617, 104.1954],
-                '广汽': [23.1291, 113.2644],
-                '福岛': [37.75, 140.47],
-                '越南': [14.0583, 108.2772],
-                '中部': [30.0, 108.0],
-            }};
+            const locationCoords = ''' + _LOC_COORDS_JSON + ''';
             
             // 添加风险标记（增加错误处理，兼容字符串/数组格式的地理位置）
-            if (Array.isArray(riskData)) {{
-                riskData.forEach(risk => {{
+            if (Array.isArray(riskData)) {
+                riskData.forEach(risk => {
                     // 兼容地理位置：字符串转数组（如"中国,美国"→["中国","美国"]）
                     let locations = risk['地理位置'] || ['未明确'];
-                    if (typeof locations === 'string') {{
+                    if (typeof locations === 'string') {
                         locations = locations.split(',').map(item => item.trim());
-                    }}
-                    const level = risk['风险等级'] || '未知';
-                    const color = levelColors[level] || '#95a5a6';
+                    }
+                    // 等级文字与颜色已在生成页面时计算好
+                    const level = risk._level_label;
+                    const color = risk._color;
                     
-                    locations.forEach(location => {{
+                    locations.forEach(location => {
                         if (!location || location === '未明确') return;
                         const coords = locationCoords[location] || [30.0, 120.0];
                         
                         // 创建标记
-                        const marker = L.circleMarker(coords, {{
+                        const marker = L.circleMarker(coords, {
                             radius: level === '高' ? 12 : level === '中' ? 10 : 8,
                             fillColor: color,
                             color: '#fff',
                             weight: 2,
                             opacity: 1,
                             fillOpacity: 0.8
-                        }}).addTo(map);
+                        }).addTo(map);
                         
-                        // 添加弹窗
-                        const popupContent = `
-                            <div style="font-family: 'Microsoft YaHei', sans-serif;">
-                                <h4 style="margin: 0 0 10px 0; color: ${{color}};">${{risk['风险名称'] || '未知风险'}}</h4>
-                                <p style="margin: 5px 0;"><strong>风险等级：</strong><span style="color: ${{color}};">${{level}}</span></p>
-                                <p style="margin: 5px 0;"><strong>地理位置：</strong>${{location}}</p>
-                                <p style="margin: 5px 0; font-size: 12px; color: #666;">${{risk['风险描述'] || '无描述'}}</p>
-                            </div>
-                        `; // 修复4：弹窗里的所有都转义
-                        marker.bindPopup(popupContent);
-                    }});
-                }});
-            }} else {{
+                        // 添加弹窗（内容在首次打开时才生成）
+                        marker.bindPopup(() => buildRiskPopup(risk, level, color, location));
+                    });
+                });
+            } else {
                 console.error('riskData不是数组格式:', riskData);
-            }}
-        }}
+            }
+        }
+        
+        // 风险标记弹窗内容
+        function buildRiskPopup(risk, level, color, location) {
+            return `
+                <div style="font-family: 'Microsoft YaHei', sans-serif;">
+                    <h4 style="margin: 0 0 10px 0; color: ${color};">${risk['风险名称'] || '未知风险'}</h4>
+                    <p style="margin: 5px 0;"><strong>风险等级：</strong><span style="color: ${color};">${level}</span></p>
+                    <p style="margin: 5px 0;"><strong>地理位置：</strong>${location}</p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #666;">${risk['风险描述'] || '无描述'}</p>
+                </div>
+            `;
+        }
+        
+        // 风险详情标题索引（序号 -> 元素），首次使用时建立，避免每次点击都查询DOM
+        let detailMap = null;
+        function getDetailElement(seq) {
+            if (!detailMap) {
+                detailMap = new Map();
+                document.querySelectorAll('.risk-detail h4[data-seq]').forEach(el => {
+                    detailMap.set(el.dataset.seq, el);
+                });
+            }
+            return detailMap.get(String(seq));
+        }
         
         // 滚动到详情（修复seq参数未使用+增加元素判空）
-        function scrollToDetail(seq) {{
-            // 根据seq找到对应的详情元素（假设seq是风险的序号，对应DOM的data-seq属性）
-            const detailSection = document.querySelector(`.risk-detail h4[data-seq="${{seq}}"]`);
-            if (detailSection) {{
-                detailSection.scrollIntoView({{ behavior: 'smooth', block: 'start' }}); // 修复6：scrollIntoView的参数转义
-            }} else {{
-                console.warn(`未找到序号为${{seq}}的风险详情`); 
-            }}
-        }}
+        function scrollToDetail(seq) {
+            // 根据seq找到对应的详情元素（seq是风险的序号，对应DOM的data-seq属性）
+            const detailSection = getDetailElement(seq);
+            if (detailSection) {
+                detailSection.scrollIntoView({ behavior: 'smooth', block: 'start' }); // 修复6：scrollIntoView的参数转义
+            } else {
+                console.warn(`未找到序号为${seq}的风险详情`); 
+            }
+        }
     </script>
 </body>
 </html>
 '''
+
+# 静态片段在导入时一次性编码为UTF-8字节，生成报告时直接以二进制写入
+_CSS_BYTES = _CSS.encode('utf-8')
+_TABLE_VIEW_START_BYTES = _TABLE_VIEW_START.encode('utf-8')
+_CARDS_VIEW_START_BYTES = _CARDS_VIEW_START.encode('utf-8')
+_MAP_VIEW_BYTES = _MAP_VIEW.encode('utf-8')
+_STATS_SEPARATOR_BYTES = _STATS_SEPARATOR.encode('utf-8')
+_RISK_DATA_SCRIPT_START_BYTES = _RISK_DATA_SCRIPT_START.encode('utf-8')
+_RISK_DATA_SCRIPT_END_BYTES = _RISK_DATA_SCRIPT_END.encode('utf-8')
+_HTML_TAIL_BYTES = _HTML_TAIL.encode('utf-8')
+
+
+def generate_html_report(parsed_data: Dict, output_file: str):
+    """生成HTML格式的报告（各片段边生成边写入文件，不在内存中拼接完整页面）"""
+    title = parsed_data['标题'] or '风险报告'
+    risks = parsed_data['风险清单']
+    
+    # 表格视图与卡片视图共用的渲染数据，以及地图脚本使用的风险数据，每条风险只计算一次
+    rendered = []
+    risk_data = []
+    for risk in risks:
+        level = risk['风险等级']
+        known_level = level in _KNOWN_LEVELS
+        locations = risk.get('地理位置', ['未明确'])
+        rendered.append((
+            risk,
+            f"risk-level-{level}" if known_level else "",  # 表格中等级单元格的样式
+            level if known_level else 'medium',  # 卡片的等级样式
+            ' '.join([f'<span class="location-tag">{loc}</span>' for loc in locations]),
+        ))
+        
+        item = {key: risk.get(key) for key in _RISK_DATA_KEYS}
+        level_label = level or '未知'
+        item['_level_label'] = level_label
+        item['_color'] = _LEVEL_COLORS.get(level_label, _DEFAULT_LEVEL_COLOR)
+        risk_data.append(item)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # 统计信息
+    risk_levels = Counter(risk['风险等级'] for risk in risks)
+    risk_categories = Counter(risk['风险类别'] for risk in risks)
+    
+    # 生成风险数据JSON（数据是新建的列表/字典，不存在循环引用，跳过循环检测）
+    risk_data_json = json.dumps(
+        risk_data, ensure_ascii=False, separators=_JSON_SEPARATORS, check_circular=False
+    )
+    
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        write = f.write
+        write((_HTML_HEAD % title).encode('utf-8'))
+        write(_CSS_BYTES)
+        write((_HTML_BODY_START % (
+            title, parsed_data['作者'] or '未知', parsed_data['日期'] or '未知'
+        )).encode('utf-8'))
+        
+        # 添加风险速览（使用markdown渲染）
+        if parsed_data['风险速览']:
+            # 将markdown内容转换为JSON字符串以便安全嵌入HTML
+            summary_markdown = json.dumps(parsed_data['风险速览'], ensure_ascii=False)
+            write((_SUMMARY_TEMPLATE % summary_markdown).encode('utf-8'))
+        
+        write(_TABLE_VIEW_START_BYTES)
+        
+        # 添加风险清单表格行
+        for risk, table_class, _, location_html in rendered:
+            write((_TABLE_ROW_TEMPLATE % (
+                risk['序号'], risk['风险名称'], risk['风险类别'],
+                table_class, risk['风险等级'], location_html, risk['风险描述']
+            )).encode('utf-8'))
+        
+        write(_CARDS_VIEW_START_BYTES)
+        
+        # 添加风险卡片
+        for risk, _, card_class, location_html in rendered:
+            description = risk['风险描述']
+            short_description = description[:80] + ('...' if len(description) > 80 else '')
+            write((_CARD_TEMPLATE % (
+                card_class, risk['序号'], risk['风险名称'], card_class, risk['风险等级'],
+                risk['风险类别'], location_html, short_description
+            )).encode('utf-8'))
+        
+        write(_MAP_VIEW_BYTES)
+        
+        # 添加统计信息
+        write((_STATS_START % len(risks)).encode('utf-8'))
+        for level, count in risk_levels.most_common():
+            write((_STAT_BOX_TEMPLATE % (f'{level}风险', count)).encode('utf-8'))
+        write(_STATS_SEPARATOR_BYTES)
+        for category, count in risk_categories.most_common():
+            write((_STAT_BOX_TEMPLATE % (category, count)).encode('utf-8'))
+        
+        write(_RISK_DATA_SCRIPT_START_BYTES)
+        write(risk_data_json.encode('utf-8'))
+        write(_RISK_DATA_SCRIPT_END_BYTES)
+        write(_HTML_TAIL_BYTES)
     
     print(f"✓ 已生成HTML报告: {output_file}")
 
 
+def get_output_html_path(report_path: str) -> str:
+    """
+    根据报告文件路径生成HTML输出路径
+    
+    参数:
+        report_path: 报告文件路径
+    
+    返回:
+        str: 同目录下的 <文件名>_simple.html（标准报告文件名简写为 report_simple.html）
+    """
+    directory, filename = os.path.split(report_path)
+    stem = os.path.splitext(filename)[0]
+    if stem == 'research_assessment_manager_report':
+        stem = 'report'
+    return os.path.join(directory, f'{stem}_simple.html')
+
+
 def main():
     """主函数"""
-    import sys
-    
-    # 默认报告路径
-    if len(sys.argv) > 1:
-        report_path = sys.argv[1]
-    else:
-        report_path = "reports/2026-01-14_20-23-57/research_assessment_manager_report.md"
+    # 报告路径（可同时指定多个报告文件，未指定时使用默认报告）
+    report_paths = sys.argv[1:] or [DEFAULT_REPORT]
     
     # 检查文件是否存在
-    if not os.path.exists(report_path):
-        print(f"错误: 报告文件不存在: {report_path}")
-        print("用法: python main_simple.py [报告文件路径]")
-        return
+    for report_path in report_paths:
+        if not os.path.isfile(report_path):
+            print(f"错误: 报告文件不存在: {report_path}")
+            print("用法: python main_simple.py [报告文件路径 ...]")
+            return
     
     try:
-        # 解析报告
-        print(f"正在解析报告: {report_path}")
-        parser = RiskReportParser(report_path)
-        parsed_data = parser.parse_all()
-        
-        # 打印摘要
-        print_report_summary(parsed_data)
-        
-        # 生成HTML报告
-        output_html = report_path.replace('.md', '_simple.html').replace('research_assessment_manager_report', 'report')
-        generate_html_report(parsed_data, output_html)
-        
-        print(f"\n解析完成！")
-        print(f"  - 风险数量: {len(parsed_data['风险清单'])}")
-        print(f"  - 详情数量: {len(parsed_data['风险详情'])}")
-        print(f"  - HTML报告: {output_html}")
+        # 解析报告（多个报告时并行解析）
+        for report_path in report_paths:
+            print(f"正在解析报告: {report_path}")
+        all_parsed_data = parse_reports(report_paths)
+        
+        for report_path, parsed_data in zip(report_paths, all_parsed_data):
+            # 打印摘要
+            print_report_summary(parsed_data)
+            
+            # 生成HTML报告
+            output_html = get_output_html_path(report_path)
+            generate_html_report(parsed_data, output_html)
+            
+            # 汇总信息一次性写出
+            sys.stdout.write(
+                f"\n解析完成！\n"
+                f"  - 风险数量: {len(parsed_data['风险清单'])}\n"
+                f"  - 详情数量: {len(parsed_data['风险详情'])}\n"
+                f"  - HTML报告: {output_html}\n"
+            )
         
     except Exception as e:
-        print(f"错误: {e}")
+        sys.stderr.write(f"错误: {e}\n")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stderr)
 
 
 if __name__ == "__main__":